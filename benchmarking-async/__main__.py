@@ -9,6 +9,7 @@ Or run directly:
     python __main__.py sweep ...
 """
 
+import importlib
 import sys
 import os
 
@@ -16,6 +17,17 @@ import os
 if __name__ == "__main__":
     sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
+# Package this entry point belongs to, resolved once: set when run with -m,
+# empty when run directly as a script
+_PACKAGE = __package__ or ""
+
+# Subcommand name -> CLI module (relative to the tool root)
+COMMANDS = {
+    "single": "cli.single",
+    "sweep": "cli.sweep",
+    "server": "cli.server",
+}
+
 
 def print_help():
     """Print usage help."""
@@ -31,6 +43,7 @@ Or run directly:
 Commands:
     single    Run a single load test against one directory
     sweep     Run file size sweep across multiple directories
+    server    Keep imports warm and serve single/sweep runs over a UNIX socket
 
 Examples:
     # Single directory test
@@ -47,6 +60,9 @@ Examples:
         --token $DXR_API_KEY \\
         --directories samples/100K,samples/1GB,samples/2GB
 
+    # Persistent worker for harnesses that run many benchmarks
+    python -m . server --socket /tmp/bench.sock
+
 Use '<command> --help' for more information on a specific command.
 """)
 
@@ -66,30 +82,13 @@ def main():
     # Remove the command from argv so subcommand parsers work correctly
     sys.argv = [sys.argv[0]] + sys.argv[2:]
 
-    # Try relative imports first (when run as module), fall back to absolute (when run directly)
-    try:
-        if command == "single":
-            from .cli.single import main as single_main
-            single_main()
-        elif command == "sweep":
-            from .cli.sweep import main as sweep_main
-            sweep_main()
-        else:
-            print(f"Unknown command: {command}")
-            print_help()
-            sys.exit(1)
-    except ImportError:
-        # Fall back to absolute imports for direct execution
-        if command == "single":
-            from cli.single import main as single_main
-            single_main()
-        elif command == "sweep":
-            from cli.sweep import main as sweep_main
-            sweep_main()
-        else:
-            print(f"Unknown command: {command}")
-            print_help()
-            sys.exit(1)
+    module_name = COMMANDS.get(command)
+    if module_name is None:
+        print(f"Unknown command: {command}")
+        print_help()
+        sys.exit(1)
+
+    importlib.import_module(f"{_PACKAGE}.{module_name}" if _PACKAGE else module_name).main()
 
 
 if __name__ == "__main__":
@@ -1 +1,21 @@
 """CLI command handlers for async benchmarking."""
+
+import importlib
+from types import ModuleType
+
+# Root package of the tool, resolved once: the parent package name when
+# imported as a package, or "" when run directly from benchmarking-async
+_ROOT_PACKAGE = __package__.rpartition(".")[0] if __package__ else ""
+
+
+def import_tool_module(name: str) -> ModuleType:
+    """
+    Import a module of the benchmarking tool by its tool-relative name.
+
+    Args:
+        name: Dotted module name relative to the tool root (e.g. "core.models")
+
+    Returns:
+        The imported module
+    """
+    return importlib.import_module(f"{_ROOT_PACKAGE}.{name}" if _ROOT_PACKAGE else name)
@@ -0,0 +1,87 @@
+"""Event loop selection for async benchmarking CLI commands."""
+
+import asyncio
+import atexit
+import sys
+from typing import Any, Coroutine, Optional, TypeVar
+
+# uvloop is optional; fall back to the stock asyncio loop when unavailable
+if sys.platform != "win32":
+    try:
+        import uvloop
+    except ImportError:
+        uvloop = None
+else:
+    uvloop = None
+
+T = TypeVar("T")
+
+# Loop shared by in-process (embedded) runs, created on first use
+_persistent_loop: Optional[asyncio.AbstractEventLoop] = None
+
+
+def run(coro: Coroutine[Any, Any, T]) -> T:
+    """
+    Run a coroutine to completion, using uvloop when it is installed.
+
+    Args:
+        coro: Coroutine to run
+
+    Returns:
+        The coroutine's result
+    """
+    if uvloop is None:
+        return asyncio.run(coro)
+
+    # uvloop.run() only exists from uvloop 0.18
+    if sys.version_info >= (3, 11) and hasattr(uvloop, "run"):
+        return uvloop.run(coro)
+
+    uvloop.install()
+    return asyncio.run(coro)
+
+
+def new_event_loop() -> asyncio.AbstractEventLoop:
+    """Create a new event loop, using uvloop when it is installed."""
+    if uvloop is not None:
+        return uvloop.new_event_loop()
+    return asyncio.new_event_loop()
+
+
+def run_persistent(coro: Coroutine[Any, Any, T]) -> T:
+    """
+    Run a coroutine on a process-wide loop that stays open between calls.
+
+    Used when the CLI is invoked repeatedly in one process (e.g. from a
+    notebook or CI harness) so loop setup is paid only once. The loop is
+    closed by close_persistent_loop(), or automatically at interpreter exit.
+
+    Args:
+        coro: Coroutine to run
+
+    Returns:
+        The coroutine's result
+    """
+    global _persistent_loop
+    if _persistent_loop is None or _persistent_loop.is_closed():
+        _persistent_loop = new_event_loop()
+        asyncio.set_event_loop(_persistent_loop)
+        atexit.register(close_persistent_loop)
+    return _persistent_loop.run_until_complete(coro)
+
+
+def close_persistent_loop() -> None:
+    """Shut down and close the persistent loop, if one is open."""
+    global _persistent_loop
+    loop = _persistent_loop
+    if loop is None or loop.is_closed():
+        return
+
+    try:
+        loop.run_until_complete(loop.shutdown_asyncgens())
+        loop.run_until_complete(loop.shutdown_default_executor())
+    finally:
+        asyncio.set_event_loop(None)
+        loop.close()
+        _persistent_loop = None
+        atexit.unregister(close_persistent_loop)
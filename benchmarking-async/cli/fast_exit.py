@@ -0,0 +1,28 @@
+"""Process exit handling for async benchmarking CLI commands."""
+
+import os
+import sys
+
+# Set BENCH_FAST_EXIT=1 to skip interpreter shutdown after a completed run
+FAST_EXIT_ENV_VAR = "BENCH_FAST_EXIT"
+
+
+def finish(code: int = 0) -> None:
+    """
+    Finish a completed CLI run with the given exit code.
+
+    When BENCH_FAST_EXIT=1 is set, output is flushed and the process exits
+    immediately via os._exit, skipping garbage collection, atexit handlers and
+    matplotlib teardown. Otherwise a zero code simply returns and a non-zero
+    code raises SystemExit as usual.
+
+    Args:
+        code: Process exit code
+    """
+    if os.environ.get(FAST_EXIT_ENV_VAR) == "1":
+        sys.stdout.flush()
+        sys.stderr.flush()
+        os._exit(code)
+
+    if code:
+        sys.exit(code)
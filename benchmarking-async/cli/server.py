@@ -0,0 +1,211 @@
+"""Persistent worker that serves single/sweep runs over a UNIX domain socket.
+
+Keeps the interpreter and its imports (aiohttp, ...) warm so a harness
+that runs many benchmarks does not pay process start-up for each one.
+
+Protocol (one request per connection):
+    Client sends a single line:  <command> <json-args>\\n
+        command:   "single" or "sweep"
+        json-args: either a JSON list of CLI arguments, e.g.
+                       ["--server-url", "https://dev.dataxray.io", "--quiet", ...]
+                   or a JSON object of option names to values, e.g.
+                       {"server_url": "https://dev.dataxray.io", "quiet": true, ...}
+    Server replies with the results as TSV lines (header first), or a single
+    line "ERROR\\t<message>" if the run could not be performed.
+
+Chart options are ignored in server mode.
+"""
+
+import argparse
+import asyncio
+import functools
+import json
+import os
+import sys
+from typing import Any, List, Optional
+
+from . import import_tool_module
+from . import single as single_cli
+from . import sweep as sweep_cli
+from .event_loop import run as run_async
+
+DEFAULT_SOCKET_PATH = "/tmp/benchmarking-async.sock"
+
+
+@functools.lru_cache(maxsize=1)
+def _build_parser() -> argparse.ArgumentParser:
+    """Build the argument parser (cached across repeated invocations)."""
+    parser = argparse.ArgumentParser(
+        description="Serve single/sweep runs over a UNIX domain socket, keeping imports warm",
+    )
+    parser.add_argument(
+        "--socket",
+        default=DEFAULT_SOCKET_PATH,
+        help=f"UNIX socket path to listen on (default: {DEFAULT_SOCKET_PATH})"
+    )
+    return parser
+
+
+def _to_argv(payload: Any) -> List[str]:
+    """Convert a JSON request payload into a CLI argument list."""
+    if isinstance(payload, list):
+        return [str(arg) for arg in payload]
+
+    if not isinstance(payload, dict):
+        raise ValueError("Arguments must be a JSON list or object")
+
+    argv = []
+    for key, value in payload.items():
+        flag = f"--{key.replace('_', '-')}"
+        if value is True:
+            argv.append(flag)
+        elif value is not False and value is not None:
+            argv.extend([flag, str(value)])
+    return argv
+
+
+def _redact(argv: List[str]) -> str:
+    """Join arguments for display, masking the --token value as the CLIs do."""
+    shown = []
+    mask_next = False
+    for arg in argv:
+        if mask_next:
+            shown.append("***provided***")
+            mask_next = False
+            continue
+        flag, eq, _ = arg.partition("=")
+        # argparse also accepts unambiguous prefixes such as --tok
+        if len(flag) > 2 and "--token".startswith(flag):
+            if eq:
+                arg = f"{flag}=***provided***"
+            else:
+                mask_next = True
+        shown.append(arg)
+    return " ".join(shown)
+
+
+def _parse_args(parser: argparse.ArgumentParser, argv: List[str]) -> argparse.Namespace:
+    """Parse arguments without letting argparse exit the server."""
+    try:
+        return parser.parse_args(argv)
+    except SystemExit:
+        raise ValueError(f"Invalid arguments: {_redact(argv)}")
+
+
+class BenchmarkServer:
+    """Runs benchmark commands received over a UNIX domain socket."""
+
+    def __init__(self, socket_path: str):
+        """
+        Initialize the server.
+
+        Args:
+            socket_path: UNIX socket path to listen on
+        """
+        self.socket_path = socket_path
+        # One run at a time so concurrent requests don't skew each other's
+        # numbers; created inside the running loop in serve_forever()
+        self._run_lock: Optional[asyncio.Lock] = None
+
+        # Warm the heavy imports once for the lifetime of the server
+        self._AsyncTester = import_tool_module("core.async_tester").AsyncTester
+        self._AsyncResultAggregator = import_tool_module("results.aggregator").AsyncResultAggregator
+        self._FileSizeSweep = import_tool_module("sweeps.file_size_sweep").FileSizeSweep
+
+    async def _run_single(self, argv: List[str]) -> str:
+        """Run a single directory test and return its TSV results."""
+        args = _parse_args(single_cli._build_parser(), argv)
+        if not os.path.isdir(args.samples_dir):
+            raise ValueError(f"Samples directory not found: {args.samples_dir}")
+
+        tester = self._AsyncTester(single_cli.build_config(args), verbose=not args.quiet)
+        result = await tester.run()
+
+        aggregator = self._AsyncResultAggregator()
+        aggregator.add_result(result)
+        return aggregator.get_tsv_string()
+
+    async def _run_sweep(self, argv: List[str]) -> str:
+        """Run a file size sweep and return its TSV results."""
+        args = _parse_args(sweep_cli._build_parser(), argv)
+        directories = sweep_cli.resolve_directories(args)
+
+        sweep = self._FileSizeSweep(sweep_cli.build_config(args), verbose=not args.quiet)
+        await sweep.run(
+            directories=directories,
+            files_per_request=args.files_per_request,
+            concurrency=args.concurrency,
+            repeat=args.repeat,
+            pipeline_depth=args.pipeline_depth,
+        )
+        return sweep.get_aggregator().get_tsv_string()
+
+    async def _handle_client(
+        self,
+        reader: asyncio.StreamReader,
+        writer: asyncio.StreamWriter,
+    ) -> None:
+        """Handle one request: read a command line, run it, reply with TSV."""
+        try:
+            line = (await reader.readline()).decode("utf-8").strip()
+            command, _, payload = line.partition(" ")
+            argv = _to_argv(json.loads(payload) if payload else [])
+
+            if command == "single":
+                handler = self._run_single
+            elif command == "sweep":
+                handler = self._run_sweep
+            else:
+                raise ValueError(f"Unknown command: {command}")
+
+            async with self._run_lock:
+                print(f"[Server] Running {command} {_redact(argv)}")
+                response = await handler(argv)
+        except Exception as e:
+            response = f"ERROR\t{e}\n"
+
+        try:
+            writer.write(response.encode("utf-8"))
+            await writer.drain()
+        finally:
+            writer.close()
+            await writer.wait_closed()
+
+    async def serve_forever(self) -> None:
+        """Listen on the socket and serve requests until cancelled."""
+        self._run_lock = asyncio.Lock()
+        if os.path.exists(self.socket_path):
+            os.unlink(self.socket_path)
+
+        server = await asyncio.start_unix_server(self._handle_client, path=self.socket_path)
+        print(f"Benchmark server listening on {self.socket_path}")
+        try:
+            async with server:
+                await server.serve_forever()
+        finally:
+            if os.path.exists(self.socket_path):
+                os.unlink(self.socket_path)
+
+
+def main(argv: Optional[List[str]] = None):
+    """
+    Main entry point for the persistent benchmark server.
+
+    Args:
+        argv: Command line arguments (defaults to sys.argv[1:])
+    """
+    args = _build_parser().parse_args(argv)
+
+    if not hasattr(asyncio, "start_unix_server"):
+        print("Error: UNIX domain sockets are not supported on this platform")
+        sys.exit(1)
+
+    server = BenchmarkServer(args.socket)
+    try:
+        run_async(server.serve_forever())
+    except KeyboardInterrupt:
+        print("\nServer stopped")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,53 +1,54 @@
 """Single directory load test CLI command."""
 
 import argparse
-import asyncio
+import functools
+import os
 import sys
-
-# Support both relative and absolute imports
-try:
-    from ..core.models import AsyncTestConfig
-    from ..core.async_tester import AsyncTester
-    from ..results.aggregator import AsyncResultAggregator
-    from ..results.charts import generate_single_test_chart
-except (ImportError, ValueError):
-    from core.models import AsyncTestConfig
-    from core.async_tester import AsyncTester
-    from results.aggregator import AsyncResultAggregator
-    from results.charts import generate_single_test_chart
-
-
-def main():
-    """Main entry point for single directory test."""
+import textwrap
+from typing import List, Optional
+
+from . import import_tool_module
+from .event_loop import run as run_async
+from .fast_exit import finish
+
+AsyncTestConfig = import_tool_module("core.models").AsyncTestConfig
+
+
+_SINGLE_EPILOG = textwrap.dedent("""\
+    Examples:
+      # Basic test with default settings
+      python -m benchmarking_async single \\
+          --server-url https://dev.dataxray.io \\
+          --datasource-id 100 \\
+          --token $DXR_API_KEY \\
+          --samples-dir samples/100K
+
+      # Test with batching (5 files per request)
+      python -m benchmarking_async single \\
+          --server-url https://dev.dataxray.io \\
+          --datasource-id 100 \\
+          --token $DXR_API_KEY \\
+          --samples-dir samples/1GB \\
+          --files-per-request 5
+
+      # Parallel test with 3 concurrent requests
+      python -m benchmarking_async single \\
+          --server-url https://dev.dataxray.io \\
+          --datasource-id 100 \\
+          --token $DXR_API_KEY \\
+          --samples-dir samples/100K \\
+          --concurrency 3 \\
+          --repeat 10
+""")
+
+
+@functools.lru_cache(maxsize=1)
+def _build_parser() -> argparse.ArgumentParser:
+    """Build the argument parser (cached across repeated invocations)."""
     parser = argparse.ArgumentParser(
         description="Run a single async load test against one directory",
-        formatter_class=argparse.RawDescriptionHelpFormatter,
-        epilog="""
-Examples:
-  # Basic test with default settings
-  python -m benchmarking_async single \\
-      --server-url https://dev.dataxray.io \\
-      --datasource-id 100 \\
-      --token $DXR_API_KEY \\
-      --samples-dir samples/100K
-
-  # Test with batching (5 files per request)
-  python -m benchmarking_async single \\
-      --server-url https://dev.dataxray.io \\
-      --datasource-id 100 \\
-      --token $DXR_API_KEY \\
-      --samples-dir samples/1GB \\
-      --files-per-request 5
-
-  # Parallel test with 3 concurrent requests
-  python -m benchmarking_async single \\
-      --server-url https://dev.dataxray.io \\
-      --datasource-id 100 \\
-      --token $DXR_API_KEY \\
-      --samples-dir samples/100K \\
-      --concurrency 3 \\
-      --repeat 10
-        """,
+        formatter_class=argparse.RawTextHelpFormatter,
+        epilog=_SINGLE_EPILOG,
     )
 
     # Required connection arguments
@@ -104,7 +105,13 @@ Examples:
         "--poll-interval",
         type=int,
         default=5,
-        help="Job polling interval in seconds (default: 5)"
+        help="Initial job polling interval in seconds (default: 5)"
+    )
+    parser.add_argument(
+        "--poll-interval-max",
+        type=int,
+        default=30,
+        help="Maximum polling interval in seconds as polling backs off (default: 30)"
     )
 
     # SSL
@@ -136,16 +143,12 @@ Examples:
         help="Suppress progress output (only show final results)"
     )
 
-    args = parser.parse_args()
+    return parser
 
-    # Validate samples directory
-    import os
-    if not os.path.isdir(args.samples_dir):
-        print(f"Error: Samples directory not found: {args.samples_dir}")
-        sys.exit(1)
 
-    # Create config
-    config = AsyncTestConfig(
+def build_config(args: argparse.Namespace) -> AsyncTestConfig:
+    """Create the test configuration from parsed arguments."""
+    return AsyncTestConfig(
         server_url=args.server_url,
         datasource_id=args.datasource_id,
         api_token=args.token,
@@ -155,9 +158,32 @@ Examples:
         repeat=args.repeat,
         job_timeout_seconds=args.timeout,
         poll_interval_seconds=args.poll_interval,
+        poll_interval_max_seconds=args.poll_interval_max,
         insecure_ssl=args.insecure_ssl,
     )
 
+
+def main(argv: Optional[List[str]] = None):
+    """
+    Main entry point for single directory test.
+
+    Args:
+        argv: Command line arguments (defaults to sys.argv[1:])
+    """
+    args = _build_parser().parse_args(argv)
+
+    # Imported after parsing so --help and argument errors skip aiohttp/pandas
+    AsyncTester = import_tool_module("core.async_tester").AsyncTester
+    AsyncResultAggregator = import_tool_module("results.aggregator").AsyncResultAggregator
+
+    # Validate samples directory
+    if not os.path.isdir(args.samples_dir):
+        print(f"Error: Samples directory not found: {args.samples_dir}")
+        sys.exit(1)
+
+    # Create config
+    config = build_config(args)
+
     # Run test
     print(f"\nAsync Load Test: {args.samples_dir}")
     print("=" * 60)
@@ -165,7 +191,7 @@ Examples:
     tester = AsyncTester(config, verbose=not args.quiet)
 
     try:
-        result = asyncio.run(tester.run())
+        result = run_async(tester.run())
 
         # Print results
         aggregator = AsyncResultAggregator()
@@ -179,12 +205,12 @@ Examples:
 
         # Generate chart if not disabled
         if not args.no_chart and result.raw_job_results:
+            generate_single_test_chart = import_tool_module("results.charts").generate_single_test_chart
             chart_path = args.chart
             generate_single_test_chart(result, output_path=chart_path, show=False)
 
         # Exit with error code if there were failures
-        if result.error_rate > 0:
-            sys.exit(1)
+        finish(1 if result.error_rate > 0 else 0)
 
     except KeyboardInterrupt:
         print("\nTest interrupted by user")
@@ -1,54 +1,103 @@
 """File size sweep CLI command."""
 
 import argparse
-import asyncio
+import functools
 import os
 import sys
+import textwrap
 from datetime import datetime
+from typing import Dict, Iterator, List, Optional
 
-# Support both relative and absolute imports
-try:
-    from ..core.models import AsyncTestConfig
-    from ..sweeps.file_size_sweep import FileSizeSweep
-    from ..results.charts import generate_sweep_charts
-except (ImportError, ValueError):
-    from core.models import AsyncTestConfig
-    from sweeps.file_size_sweep import FileSizeSweep
-    from results.charts import generate_sweep_charts
+from . import import_tool_module
+from .event_loop import run as run_async, run_persistent
+from .fast_exit import finish
 
+AsyncTestConfig = import_tool_module("core.models").AsyncTestConfig
 
-def main():
-    """Main entry point for file size sweep."""
+
+_SWEEP_EPILOG = textwrap.dedent("""\
+    Examples:
+      # Basic sweep with comma-separated directories
+      python -m benchmarking_async sweep \\
+          --server-url https://dev.dataxray.io \\
+          --datasource-id 100 \\
+          --token $DXR_API_KEY \\
+          --directories samples/100K,samples/1GB,samples/2GB
+
+      # Sweep with batching and output files
+      python -m benchmarking_async sweep \\
+          --server-url https://dev.dataxray.io \\
+          --datasource-id 100 \\
+          --token $DXR_API_KEY \\
+          --directories samples/100K,samples/500MB,samples/1GB \\
+          --files-per-request 5 \\
+          --repeat 3 \\
+          --output results.tsv \\
+          --chart results.png
+
+      # Using a directories file
+      python -m benchmarking_async sweep \\
+          --server-url https://dev.dataxray.io \\
+          --datasource-id 100 \\
+          --token $DXR_API_KEY \\
+          --directories-file sweep_dirs.txt
+""")
+
+
+def _iter_directories_file(path: str) -> Iterator[str]:
+    """Yield directories from a file, one per line, skipping blanks and # comments."""
+    with open(path, "r") as f:
+        for raw in f:
+            line = raw.strip()
+            if line and line[0] != "#":
+                yield line
+
+
+def _find_missing_directories(directories: List[str]) -> List[str]:
+    """
+    Return the directories that do not exist, in their original order.
+
+    Directories that share a parent are checked with a single os.scandir() of
+    that parent instead of one stat() per directory, which matters on
+    network-mounted sample trees.
+    """
+    by_parent: Dict[str, List[str]] = {}
+    for d in directories:
+        by_parent.setdefault(os.path.dirname(os.path.normpath(d)), []).append(d)
+
+    missing = set()
+    for parent, children in by_parent.items():
+        if len(children) == 1:
+            if not os.path.isdir(children[0]):
+                missing.add(children[0])
+            continue
+
+        try:
+            with os.scandir(parent or ".") as entries:
+                subdirs = {entry.name for entry in entries if entry.is_dir()}
+        except OSError:
+            missing.update(children)
+            continue
+
+        for d in children:
+            name = os.path.basename(os.path.normpath(d))
+            # scandir never lists "." or "..", so check those directly
+            if name in (".", ".."):
+                if not os.path.isdir(d):
+                    missing.add(d)
+            elif name not in subdirs:
+                missing.add(d)
+
+    return [d for d in directories if d in missing]
+
+
+@functools.lru_cache(maxsize=1)
+def _build_parser() -> argparse.ArgumentParser:
+    """Build the argument parser (cached across repeated invocations)."""
     parser = argparse.ArgumentParser(
         description="Run file size sweep benchmark across multiple directories",
-        formatter_class=argparse.RawDescriptionHelpFormatter,
-        epilog="""
-Examples:
-  # Basic sweep with comma-separated directories
-  python -m benchmarking_async sweep \\
-      --server-url https://dev.dataxray.io \\
-      --datasource-id 100 \\
-      --token $DXR_API_KEY \\
-      --directories samples/100K,samples/1GB,samples/2GB
-
-  # Sweep with batching and output files
-  python -m benchmarking_async sweep \\
-      --server-url https://dev.dataxray.io \\
-      --datasource-id 100 \\
-      --token $DXR_API_KEY \\
-      --directories samples/100K,samples/500MB,samples/1GB \\
-      --files-per-request 5 \\
-      --repeat 3 \\
-      --output results.tsv \\
-      --chart results.png
-
-  # Using a directories file
-  python -m benchmarking_async sweep \\
-      --server-url https://dev.dataxray.io \\
-      --datasource-id 100 \\
-      --token $DXR_API_KEY \\
-      --directories-file sweep_dirs.txt
-        """,
+        formatter_class=argparse.RawTextHelpFormatter,
+        epilog=_SWEEP_EPILOG,
     )
 
     # Required connection arguments
@@ -101,6 +150,12 @@ Examples:
         default=1,
         help="Repeat sample files N times to increase load (default: 1)"
     )
+    parser.add_argument(
+        "--pipeline-depth",
+        type=int,
+        default=1,
+        help="Number of directory stages to run at once (default: 1 = one stage at a time)"
+    )
 
     # Timeout settings
     parser.add_argument(
@@ -113,7 +168,13 @@ Examples:
         "--poll-interval",
         type=int,
         default=5,
-        help="Job polling interval in seconds (default: 5)"
+        help="Initial job polling interval in seconds (default: 5)"
+    )
+    parser.add_argument(
+        "--poll-interval-max",
+        type=int,
+        default=30,
+        help="Maximum polling interval in seconds as polling backs off (default: 30)"
     )
 
     # SSL
@@ -144,50 +205,92 @@ Examples:
         action="store_true",
         help="Suppress progress output (only show final results)"
     )
+    parser.add_argument(
+        "--embed",
+        action="store_true",
+        help="Keep the event loop open for further in-process runs (notebooks, harnesses)"
+    )
+
+    return parser
+
 
-    args = parser.parse_args()
+def resolve_directories(args: argparse.Namespace) -> List[str]:
+    """
+    Resolve and validate the directories to sweep from parsed arguments.
 
-    # Parse directories
+    Returns:
+        Directories to sweep, in order
+
+    Raises:
+        ValueError: If the directories file is missing, no directories are
+            given, or any directory does not exist
+    """
     if args.directories:
-        directories = [d.strip() for d in args.directories.split(",") if d.strip()]
+        directories = [d for d in (part.strip() for part in args.directories.split(",")) if d]
     else:
         try:
-            with open(args.directories_file, "r") as f:
-                directories = [line.strip() for line in f if line.strip() and not line.startswith("#")]
+            directories = list(_iter_directories_file(args.directories_file))
         except FileNotFoundError:
-            print(f"Error: Directories file not found: {args.directories_file}")
-            sys.exit(1)
+            raise ValueError(f"Directories file not found: {args.directories_file}")
 
     if not directories:
-        print("Error: No directories specified")
-        sys.exit(1)
+        raise ValueError("No directories specified")
 
     # Validate directories exist
-    for d in directories:
-        if not os.path.isdir(d):
-            print(f"Error: Directory not found: {d}")
-            sys.exit(1)
+    missing = _find_missing_directories(directories)
+    if missing:
+        raise ValueError(f"Directory not found: {', '.join(missing)}")
 
-    # Create base config
-    config = AsyncTestConfig(
+    return directories
+
+
+def build_config(args: argparse.Namespace) -> AsyncTestConfig:
+    """Create the base sweep configuration from parsed arguments."""
+    return AsyncTestConfig(
         server_url=args.server_url,
         datasource_id=args.datasource_id,
         api_token=args.token,
         samples_dir="",  # Will be overridden per stage
         job_timeout_seconds=args.timeout,
         poll_interval_seconds=args.poll_interval,
+        poll_interval_max_seconds=args.poll_interval_max,
         insecure_ssl=args.insecure_ssl,
     )
 
+
+def main(argv: Optional[List[str]] = None):
+    """
+    Main entry point for file size sweep.
+
+    Args:
+        argv: Command line arguments (defaults to sys.argv[1:])
+    """
+    args = _build_parser().parse_args(argv)
+
+    # Imported after parsing so --help and argument errors skip aiohttp/pandas
+    FileSizeSweep = import_tool_module("sweeps.file_size_sweep").FileSizeSweep
+
+    try:
+        directories = resolve_directories(args)
+    except ValueError as e:
+        print(f"Error: {e}")
+        sys.exit(1)
+
+    # Create base config
+    config = build_config(args)
+
     # Create and run sweep
     sweep = FileSizeSweep(config, verbose=not args.quiet)
 
     try:
-        result = asyncio.run(sweep.run(
+        # Embedded runs reuse one loop across calls instead of a fresh loop each time
+        runner = run_persistent if args.embed else run_async
+        result = runner(sweep.run(
             directories=directories,
             files_per_request=args.files_per_request,
             concurrency=args.concurrency,
             repeat=args.repeat,
+            pipeline_depth=args.pipeline_depth,
         ))
 
         # Export TSV if requested
@@ -197,10 +300,8 @@ Examples:
 
         # Generate chart if not disabled
         if not args.no_chart and result.stage_results:
-            chart_path = args.chart
-            if not chart_path:
-                timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-                chart_path = f"sweep_results_{timestamp}.png"
+            generate_sweep_charts = import_tool_module("results.charts").generate_sweep_charts
+            chart_path = args.chart or f"sweep_results_{datetime.now():%Y%m%d_%H%M%S}.png"
             generate_sweep_charts(result.stage_results, output_path=chart_path, show=False)
 
         # Print summary
@@ -210,8 +311,7 @@ Examples:
         print(f"Overall error rate: {result.overall_error_rate:.2f}%")
 
         # Exit with error code if there were failures
-        if result.overall_error_rate > 0:
-            sys.exit(1)
+        finish(1 if result.overall_error_rate > 0 else 0)
 
     except KeyboardInterrupt:
         print("\n\nSweep interrupted by user")
@@ -3,26 +3,75 @@
 import aiohttp
 import asyncio
 import json
-import os
+import random
 import ssl
 import time
 from datetime import datetime
-from typing import List, Tuple, Optional
+from itertools import islice
+from typing import Any, Dict, Iterable, Iterator, List, Tuple, Optional, TypeVar
+
+# orjson is optional; it parses the poll responses noticeably faster
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
 
 # Support both relative and absolute imports
 try:
+    from .file_payload import SampleFilePayload
     from .models import AsyncTestConfig, AsyncTestResult, JobResult
     from .sample_loader import SampleLoader
 except (ImportError, ValueError):
+    from core.file_payload import SampleFilePayload
     from core.models import AsyncTestConfig, AsyncTestResult, JobResult
     from core.sample_loader import SampleLoader
 
 
-def _calculate_percentile(values: List[float], percentile: float) -> float:
-    """Calculate percentile value from a list."""
-    if not values:
+# Where the job state may appear in a status response, in priority order
+_STATE_PATHS = (("state",), ("job", "state"), ("status",), ("jobState",))
+
+
+def _extract_state(data: Any) -> Optional[str]:
+    """Extract the job state from a status response, or None if absent."""
+    for path in _STATE_PATHS:
+        value = data
+        for key in path:
+            if not isinstance(value, dict):
+                value = None
+                break
+            value = value.get(key)
+        if value:
+            return value
+    return None
+
+
+T = TypeVar("T")
+
+# Job state classifications cached by AsyncTester._classify_state
+_STATE_IN_PROGRESS = 0
+_STATE_FINISHED = 1
+_STATE_FAILED = 2
+
+
+def _batched(items: Iterable[T], size: int) -> Iterator[List[T]]:
+    """Yield successive lists of up to size items, built only as they are consumed."""
+    iterator = iter(items)
+    while True:
+        batch = list(islice(iterator, size))
+        if not batch:
+            return
+        yield batch
+
+
+def _discard_log(message: str) -> None:
+    """Logger used when verbose output is disabled."""
+
+
+def _calculate_percentile(sorted_values: List[float], percentile: float) -> float:
+    """Calculate percentile value from an already sorted list."""
+    if not sorted_values:
         return 0.0
-    sorted_values = sorted(values)
     index = int(len(sorted_values) * percentile / 100)
     index = min(index, len(sorted_values) - 1)
     return sorted_values[index]
@@ -61,9 +110,19 @@ class AsyncTester:
         """
         self.config = config
         self.verbose = verbose
+        # Bind the logger once instead of checking verbose on every message
+        self._log = print if verbose else _discard_log
         self.job_results: List[JobResult] = []
         self._ssl_ctx = self._create_ssl_context()
 
+        # Identical for every submit and poll, so build them once
+        self._base_url = self.config.server_url.rstrip("/")
+        self._submit_url = f"{self._base_url}/api/on-demand-classifiers/{self.config.datasource_id}/jobs"
+        self._auth_headers = {"Authorization": f"Bearer {self.config.api_token}"}
+
+        # Raw state string -> classification; servers use a small vocabulary
+        self._state_classes: Dict[str, int] = {}
+
     def _create_ssl_context(self) -> Optional[ssl.SSLContext]:
         """Create SSL context if insecure mode is enabled."""
         if self.config.insecure_ssl:
@@ -73,15 +132,10 @@ class AsyncTester:
             return ctx
         return None
 
-    def _log(self, message: str) -> None:
-        """Print message if verbose mode is enabled."""
-        if self.verbose:
-            print(message)
-
     async def _submit_batch(
         self,
         session: aiohttp.ClientSession,
-        files: List[Tuple[str, str]],
+        files: List[Tuple[str, str, str, int]],
         batch_id: int,
         file_size_bytes: int,
     ) -> JobResult:
@@ -90,70 +144,61 @@ class AsyncTester:
 
         Args:
             session: aiohttp session
-            files: List of (filename, filepath) tuples
+            files: List of (base_name, extension, filepath, size_bytes) tuples
             batch_id: Batch identifier
             file_size_bytes: Size of each file in bytes
 
         Returns:
             JobResult with submission timing
         """
-        data = aiohttp.FormData()
-        opened_files = []
-
-        submit_start = time.time()
-
-        try:
-            for idx, (fname, fpath) in enumerate(files, 1):
-                base, ext = os.path.splitext(fname)
-                numbered_name = f"{base}_b{batch_id:03d}_f{idx:03d}{ext}"
-
-                f = open(fpath, "rb")
-                opened_files.append(f)
-
-                data.add_field(
-                    "files",
-                    f,
-                    filename=numbered_name,
-                    content_type="application/octet-stream",
+        # Build the multipart body directly rather than through FormData,
+        # which re-dispatches on each field's value type
+        data = aiohttp.MultipartWriter("form-data")
+
+        submit_start = time.monotonic()
+
+        for idx, (base, ext, fpath, size) in enumerate(files, 1):
+            numbered_name = "%s_b%03d_f%03d%s" % (base, batch_id, idx, ext)
+
+            # Sized payload: sent with Content-Length, via sendfile where possible
+            part = SampleFilePayload(fpath, size, content_type="application/octet-stream")
+            part.set_content_disposition("form-data", name="files", filename=numbered_name)
+            data.append_payload(part)
+
+            if self.verbose:
+                size_mb = size / (1024 * 1024)
+                self._log(f"  [Uploading] {numbered_name} ({size_mb:.1f} MB)")
+
+        async with session.post(self._submit_url, data=data) as response:
+            body = await response.read()
+            submit_end = time.monotonic()
+            submit_latency_ms = (submit_end - submit_start) * 1000
+
+            if response.status != 202:
+                self._log(f"  X Batch {batch_id} failed: HTTP {response.status}")
+                self._log(f"    {body[:500].decode('utf-8', 'replace')}")
+                return JobResult(
+                    job_id=None,
+                    batch_id=batch_id,
+                    file_count=len(files),
+                    file_size_bytes=file_size_bytes * len(files),
+                    submit_start=submit_start,
+                    submit_end=submit_end,
+                    submit_latency_ms=submit_latency_ms,
+                    job_start=submit_end,
+                    job_end=submit_end,
+                    job_duration_seconds=0,
+                    poll_count=0,
+                    final_state="SUBMIT_FAILED",
+                    success=False,
+                    error_message=f"HTTP {response.status}: {body[:200].decode('utf-8', 'replace')}",
                 )
 
-                if self.verbose:
-                    size = os.path.getsize(fpath)
-                    size_mb = size / (1024 * 1024)
-                    self._log(f"  [Uploading] {numbered_name} ({size_mb:.1f} MB)")
-
-            headers = {"Authorization": f"Bearer {self.config.api_token}"}
-            url = f"{self.config.server_url.rstrip('/')}/api/on-demand-classifiers/{self.config.datasource_id}/jobs"
-
-            async with session.post(url, data=data, ssl=self._ssl_ctx, headers=headers) as response:
-                text = await response.text()
-                submit_end = time.time()
-                submit_latency_ms = (submit_end - submit_start) * 1000
-
-                if response.status != 202:
-                    self._log(f"  X Batch {batch_id} failed: HTTP {response.status}")
-                    self._log(f"    {text[:500]}")
-                    return JobResult(
-                        job_id=None,
-                        batch_id=batch_id,
-                        file_count=len(files),
-                        file_size_bytes=file_size_bytes * len(files),
-                        submit_start=submit_start,
-                        submit_end=submit_end,
-                        submit_latency_ms=submit_latency_ms,
-                        job_start=submit_end,
-                        job_end=submit_end,
-                        job_duration_seconds=0,
-                        poll_count=0,
-                        final_state="SUBMIT_FAILED",
-                        success=False,
-                        error_message=f"HTTP {response.status}: {text[:200]}",
-                    )
-
-                try:
-                    json_response = json.loads(text)
-                    job_id = json_response.get("id")
+            try:
+                json_response = _json_loads(body)
+                job_id = json_response.get("id")
 
+                if self.verbose:
                     # Calculate upload speed
                     total_bytes = file_size_bytes * len(files)
                     upload_seconds = submit_latency_ms / 1000
@@ -164,45 +209,39 @@ class AsyncTester:
                     else:
                         self._log(f"  [Upload complete] job_id={job_id} ({self._format_duration(upload_seconds)})")
 
-                    return JobResult(
-                        job_id=job_id,
-                        batch_id=batch_id,
-                        file_count=len(files),
-                        file_size_bytes=file_size_bytes * len(files),
-                        submit_start=submit_start,
-                        submit_end=submit_end,
-                        submit_latency_ms=submit_latency_ms,
-                        job_start=submit_end,
-                        job_end=0,
-                        job_duration_seconds=0,
-                        poll_count=0,
-                        final_state="SUBMITTED",
-                        success=False,
-                    )
-                except Exception as e:
-                    self._log(f"  X Batch {batch_id} parse error: {e}")
-                    return JobResult(
-                        job_id=None,
-                        batch_id=batch_id,
-                        file_count=len(files),
-                        file_size_bytes=file_size_bytes * len(files),
-                        submit_start=submit_start,
-                        submit_end=submit_end,
-                        submit_latency_ms=submit_latency_ms,
-                        job_start=submit_end,
-                        job_end=submit_end,
-                        job_duration_seconds=0,
-                        poll_count=0,
-                        final_state="PARSE_ERROR",
-                        success=False,
-                        error_message=str(e),
-                    )
-        finally:
-            for f in opened_files:
-                try:
-                    f.close()
-                except Exception:
-                    pass
+                return JobResult(
+                    job_id=job_id,
+                    batch_id=batch_id,
+                    file_count=len(files),
+                    file_size_bytes=file_size_bytes * len(files),
+                    submit_start=submit_start,
+                    submit_end=submit_end,
+                    submit_latency_ms=submit_latency_ms,
+                    job_start=submit_end,
+                    job_end=0,
+                    job_duration_seconds=0,
+                    poll_count=0,
+                    final_state="SUBMITTED",
+                    success=False,
+                )
+            except Exception as e:
+                self._log(f"  X Batch {batch_id} parse error: {e}")
+                return JobResult(
+                    job_id=None,
+                    batch_id=batch_id,
+                    file_count=len(files),
+                    file_size_bytes=file_size_bytes * len(files),
+                    submit_start=submit_start,
+                    submit_end=submit_end,
+                    submit_latency_ms=submit_latency_ms,
+                    job_start=submit_end,
+                    job_end=submit_end,
+                    job_duration_seconds=0,
+                    poll_count=0,
+                    final_state="PARSE_ERROR",
+                    success=False,
+                    error_message=str(e),
+                )
 
     def _format_duration(self, seconds: float) -> str:
         """Format duration in human-readable form."""
@@ -218,6 +257,70 @@ class AsyncTester:
             secs = seconds % 60
             return f"{hours}h {mins}m {secs:.1f}s"
 
+    def _poll_delay(self, poll_count: int) -> float:
+        """
+        Get the delay before the next poll.
+
+        The interval grows by 1.5x per poll from poll_interval_seconds up to
+        poll_interval_max_seconds, with +/-20% jitter so concurrent pollers
+        don't hit the server in lockstep.
+
+        Args:
+            poll_count: Number of polls made so far for this job
+
+        Returns:
+            Delay in seconds
+        """
+        base = self.config.poll_interval_seconds
+        interval = max(base, min(self.config.poll_interval_max_seconds, base * 1.5 ** min(poll_count - 1, 10)))
+        return interval * random.uniform(0.8, 1.2)
+
+    @staticmethod
+    def _throttled_poll_delay(delay: float, retry_after: Optional[str]) -> float:
+        """Back off harder after a 429/5xx, honoring a Retry-After header in seconds."""
+        delay *= 2
+        if retry_after:
+            try:
+                delay = max(delay, float(retry_after))
+            except ValueError:
+                pass
+        return delay
+
+    @staticmethod
+    async def _sleep_before_poll(delay: float, deadline: float) -> None:
+        """Sleep until the next poll, but never past the job deadline."""
+        await asyncio.sleep(max(0.0, min(delay, deadline - time.monotonic())))
+
+    def _classify_state(self, state: Any) -> int:
+        """
+        Classify a job state as in progress, finished or failed.
+
+        Results are cached per raw state string, so repeated polls skip the
+        lowercasing and set lookups.
+
+        Args:
+            state: State value from the status response
+
+        Returns:
+            One of _STATE_IN_PROGRESS, _STATE_FINISHED or _STATE_FAILED
+        """
+        if isinstance(state, str):
+            state_class = self._state_classes.get(state)
+            if state_class is not None:
+                return state_class
+
+        state_lower = str(state).lower()
+        if state_lower in self.FINISHED_STATES:
+            state_class = _STATE_FINISHED
+        elif state_lower in self.FAILED_STATES:
+            state_class = _STATE_FAILED
+        else:
+            state_class = _STATE_IN_PROGRESS
+
+        if isinstance(state, str):
+            self._state_classes[state] = state_class
+        return state_class
+
     def _get_state_description(self, state: str) -> str:
         """Get human-readable description for a state."""
         state_lower = state.lower()
@@ -241,44 +344,44 @@ class AsyncTester:
         if not job_result.job_id:
             return job_result
 
-        url = f"{self.config.server_url.rstrip('/')}/api/on-demand-classifiers/{self.config.datasource_id}/jobs/{job_result.job_id}"
-        headers = {"Authorization": f"Bearer {self.config.api_token}"}
+        url = f"{self._submit_url}/{job_result.job_id}"
 
-        job_start = time.time()
+        job_start = time.monotonic()
         last_state = None
         last_state_time = job_start
         poll_count = 0
-        max_attempts = int(self.config.job_timeout_seconds / self.config.poll_interval_seconds)
+        # A deadline rather than an attempt count, so the timeout holds
+        # whatever the backoff does to the interval
+        deadline = job_start + self.config.job_timeout_seconds
 
         self._log(f"  [Polling] Waiting for job to start...")
 
-        for _ in range(max_attempts):
+        while time.monotonic() < deadline:
             poll_count += 1
+            delay = self._poll_delay(poll_count)
 
             try:
-                async with session.get(url, headers=headers, ssl=self._ssl_ctx) as response:
-                    text = await response.text()
+                async with session.get(url) as response:
+                    body = await response.read()
 
                     if response.status != 200:
-                        await asyncio.sleep(self.config.poll_interval_seconds)
+                        if response.status == 429 or response.status >= 500:
+                            delay = self._throttled_poll_delay(delay, response.headers.get("Retry-After"))
+                        await self._sleep_before_poll(delay, deadline)
                         continue
 
                     try:
-                        data = json.loads(text)
+                        data = _json_loads(body)
                     except Exception:
-                        await asyncio.sleep(self.config.poll_interval_seconds)
+                        await self._sleep_before_poll(delay, deadline)
                         continue
 
                     # Extract state from various possible fields
-                    state = (
-                        data.get("state")
-                        or (data.get("job") or {}).get("state")
-                        or data.get("status")
-                        or data.get("jobState")
-                    )
-
-                    if state and state != last_state:
-                        current_time = time.time()
+                    state = _extract_state(data)
+
+                    # State transitions are only tracked for progress output
+                    if self.verbose and state and state != last_state:
+                        current_time = time.monotonic()
                         state_description = self._get_state_description(state)
 
                         if last_state:
@@ -291,14 +394,12 @@ class AsyncTester:
                         last_state_time = current_time
 
                     if state:
-                        state_lower = str(state).lower()
-                        job_end = time.time()
+                        state_class = self._classify_state(state)
 
-                        if state_lower in self.FINISHED_STATES:
-                            # Print final stage duration
-                            stage_duration = job_end - last_state_time
-                            total_duration = job_end - job_start
-                            self._log(f"  [Complete] Total processing time: {self._format_duration(total_duration)}")
+                        if state_class == _STATE_FINISHED:
+                            job_end = time.monotonic()
+                            if self.verbose:
+                                self._log(f"  [Complete] Total processing time: {self._format_duration(job_end - job_start)}")
 
                             job_result.job_end = job_end
                             job_result.job_duration_seconds = job_end - job_start
@@ -307,10 +408,10 @@ class AsyncTester:
                             job_result.success = True
                             return job_result
 
-                        if state_lower in self.FAILED_STATES:
-                            stage_duration = job_end - last_state_time
-                            total_duration = job_end - job_start
-                            self._log(f"  [Failed] Total time: {self._format_duration(total_duration)}")
+                        if state_class == _STATE_FAILED:
+                            job_end = time.monotonic()
+                            if self.verbose:
+                                self._log(f"  [Failed] Total time: {self._format_duration(job_end - job_start)}")
 
                             job_result.job_end = job_end
                             job_result.job_duration_seconds = job_end - job_start
@@ -323,10 +424,10 @@ class AsyncTester:
             except Exception as e:
                 self._log(f"  [Poll error] {e}")
 
-            await asyncio.sleep(self.config.poll_interval_seconds)
+            await self._sleep_before_poll(delay, deadline)
 
         # Timeout
-        job_end = time.time()
+        job_end = time.monotonic()
         total_duration = job_end - job_start
         self._log(f"  [Timeout] Job timed out after {self._format_duration(total_duration)}")
 
@@ -341,7 +442,7 @@ class AsyncTester:
     async def _run_batch_with_polling(
         self,
         session: aiohttp.ClientSession,
-        batch: List[Tuple[str, str]],
+        batch: List[Tuple[str, str, str, int]],
         batch_id: int,
         file_size_bytes: int,
     ) -> JobResult:
@@ -359,16 +460,16 @@ class AsyncTester:
         # Load samples
         loader = SampleLoader(self.config.samples_dir, self.config.repeat)
         samples = loader.load()
+        total_files = len(loader)
         file_size_bytes = loader.get_file_size()
         file_size_label = loader.extract_size_label()
 
-        # Create batches
-        batches = [
-            samples[i:i + self.config.files_per_request]
-            for i in range(0, len(samples), self.config.files_per_request)
-        ]
+        # Batches are cut lazily as they are scheduled
+        files_per_request = self.config.files_per_request
+        total_batches = -(-total_files // files_per_request)
+        batches = _batched(samples, files_per_request)
 
-        self._log(f"\nTotal: {len(samples)} files -> {len(batches)} batches")
+        self._log(f"\nTotal: {total_files} files -> {total_batches} batches")
         self._log(f"Files per request: {self.config.files_per_request}")
         self._log(f"File size: {file_size_bytes} bytes ({file_size_label})")
         self._log(f"Concurrency: {self.config.concurrency} ({'sequential' if self.config.is_sequential else 'parallel'})\n")
@@ -379,96 +480,142 @@ class AsyncTester:
             sock_connect=30,
             sock_read=self.config.job_timeout_seconds
         )
-        connector = aiohttp.TCPConnector(limit=max(self.config.concurrency, 20))
+        # Every request goes to the same host, so size the per-host pool like the
+        # overall pool and keep connections (and their TLS sessions) alive
+        # between submits and polls
+        pool_size = max(self.config.concurrency * 2, 20)
+        connector = aiohttp.TCPConnector(
+            limit=pool_size,
+            limit_per_host=pool_size,
+            keepalive_timeout=75,
+            ttl_dns_cache=300,
+            ssl=self._ssl_ctx if self._ssl_ctx is not None else True,
+        )
 
+        # Wall-clock times are only recorded for the report; durations use
+        # the monotonic clock so clock adjustments can't skew them
         start_time = datetime.now()
+        start_mono = time.monotonic()
         self.job_results = []
 
-        async with aiohttp.ClientSession(timeout=timeout, connector=connector) as session:
+        # Auth is a session default so submits and polls don't pass it per request
+        async with aiohttp.ClientSession(timeout=timeout, connector=connector, headers=self._auth_headers) as session:
             if self.config.is_sequential:
                 # Sequential: send one batch, wait for completion, then next
                 for batch_id, batch in enumerate(batches, 1):
-                    self._log(f"Batch {batch_id}/{len(batches)} ({len(batch)} files):")
+                    if self.verbose:
+                        self._log(f"Batch {batch_id}/{total_batches} ({len(batch)} files):")
                     result = await self._run_batch_with_polling(session, batch, batch_id, file_size_bytes)
                     self.job_results.append(result)
             else:
-                # Parallel: use semaphore to limit concurrent requests
-                semaphore = asyncio.Semaphore(self.config.concurrency)
-
-                async def limited_run(batch: List[Tuple[str, str]], batch_id: int) -> JobResult:
-                    async with semaphore:
-                        self._log(f"Batch {batch_id}/{len(batches)} ({len(batch)} files):")
-                        return await self._run_batch_with_polling(session, batch, batch_id, file_size_bytes)
-
-                tasks = [
-                    limited_run(batch, batch_id)
-                    for batch_id, batch in enumerate(batches, 1)
-                ]
-                self.job_results = await asyncio.gather(*tasks)
-
+                # Parallel: a fixed pool of workers pulls batches from a bounded
+                # queue, so only `concurrency` tasks exist however many batches
+                worker_count = min(self.config.concurrency, total_batches)
+                queue: asyncio.Queue = asyncio.Queue(maxsize=worker_count * 2)
+                results: List[JobResult] = []
+
+                async def produce() -> None:
+                    for item in enumerate(batches, 1):
+                        await queue.put(item)
+                    for _ in range(worker_count):
+                        await queue.put(None)
+
+                async def worker() -> None:
+                    while True:
+                        item = await queue.get()
+                        if item is None:
+                            return
+                        batch_id, batch = item
+                        if self.verbose:
+                            self._log(f"Batch {batch_id}/{total_batches} ({len(batch)} files):")
+                        results.append(await self._run_batch_with_polling(session, batch, batch_id, file_size_bytes))
+
+                await asyncio.gather(produce(), *(worker() for _ in range(worker_count)))
+
+                # Workers finish out of order; keep results in batch order
+                results.sort(key=lambda r: r.batch_id)
+                self.job_results = results
+
+        total_duration = time.monotonic() - start_mono
         end_time = datetime.now()
 
         return self._calculate_results(
             start_time=start_time,
             end_time=end_time,
+            total_duration=total_duration,
             file_size_bytes=file_size_bytes,
             file_size_label=file_size_label,
-            total_files=len(samples),
+            total_files=total_files,
         )
 
     def _calculate_results(
         self,
         start_time: datetime,
         end_time: datetime,
+        total_duration: float,
         file_size_bytes: int,
         file_size_label: str,
         total_files: int,
     ) -> AsyncTestResult:
         """Calculate aggregate metrics from job results."""
-        total_duration = (end_time - start_time).total_seconds()
 
-        # Separate successful and failed jobs
-        successful = [r for r in self.job_results if r.success]
-        failed = [r for r in self.job_results if not r.success and r.final_state != "TIMEOUT"]
-        timed_out = [r for r in self.job_results if r.final_state == "TIMEOUT"]
+        # Collect every per-job metric in a single pass over the results
+        successful_count = failed_count = timed_out_count = 0
+        successful_files = successful_bytes = 0
+        submit_latencies: List[float] = []
+        job_durations: List[float] = []
+        poll_counts: List[int] = []
+
+        for r in self.job_results:
+            if r.success:
+                successful_count += 1
+                successful_files += r.file_count
+                successful_bytes += r.file_size_bytes
+                # Job duration metrics come from successful jobs only
+                if r.job_duration_seconds > 0:
+                    job_durations.append(r.job_duration_seconds)
+            elif r.final_state == "TIMEOUT":
+                timed_out_count += 1
+            else:
+                failed_count += 1
+
+            # Submit latency metrics (from all jobs that got a response)
+            if r.submit_latency_ms > 0:
+                submit_latencies.append(r.submit_latency_ms)
+            if r.poll_count > 0:
+                poll_counts.append(r.poll_count)
 
-        # Submit latency metrics (from all jobs that got a response)
-        submit_latencies = [r.submit_latency_ms for r in self.job_results if r.submit_latency_ms > 0]
+        submit_latencies.sort()
         if submit_latencies:
             submit_avg = sum(submit_latencies) / len(submit_latencies)
-            submit_min = min(submit_latencies)
-            submit_max = max(submit_latencies)
+            submit_min = submit_latencies[0]
+            submit_max = submit_latencies[-1]
             submit_p95 = _calculate_percentile(submit_latencies, 95)
             submit_p99 = _calculate_percentile(submit_latencies, 99)
         else:
             submit_avg = submit_min = submit_max = submit_p95 = submit_p99 = 0.0
 
-        # Job duration metrics (from successful jobs only)
-        job_durations = [r.job_duration_seconds for r in successful if r.job_duration_seconds > 0]
+        job_durations.sort()
         if job_durations:
             job_avg = sum(job_durations) / len(job_durations)
-            job_min = min(job_durations)
-            job_max = max(job_durations)
+            job_min = job_durations[0]
+            job_max = job_durations[-1]
             job_p95 = _calculate_percentile(job_durations, 95)
             job_p99 = _calculate_percentile(job_durations, 99)
         else:
             job_avg = job_min = job_max = job_p95 = job_p99 = 0.0
 
         # Polling metrics
-        poll_counts = [r.poll_count for r in self.job_results if r.poll_count > 0]
-        avg_poll_count = sum(poll_counts) / len(poll_counts) if poll_counts else 0.0
         total_polls = sum(poll_counts)
+        avg_poll_count = total_polls / len(poll_counts) if poll_counts else 0.0
 
         # Throughput
-        successful_files = sum(r.file_count for r in successful)
-        successful_bytes = sum(r.file_size_bytes for r in successful)
-
         throughput_files = successful_files / total_duration if total_duration > 0 else 0.0
         throughput_mb = (successful_bytes / (1024 * 1024)) / total_duration if total_duration > 0 else 0.0
 
         # Error rate
         total_jobs = len(self.job_results)
-        error_rate = ((len(failed) + len(timed_out)) / total_jobs * 100) if total_jobs > 0 else 0.0
+        error_rate = ((failed_count + timed_out_count) / total_jobs * 100) if total_jobs > 0 else 0.0
 
         return AsyncTestResult(
             samples_dir=self.config.samples_dir,
@@ -478,9 +625,9 @@ class AsyncTester:
             concurrency=self.config.concurrency,
             total_files=total_files,
             total_jobs=total_jobs,
-            successful_jobs=len(successful),
-            failed_jobs=len(failed),
-            timed_out_jobs=len(timed_out),
+            successful_jobs=successful_count,
+            failed_jobs=failed_count,
+            timed_out_jobs=timed_out_count,
             submit_avg_ms=submit_avg,
             submit_min_ms=submit_min,
             submit_max_ms=submit_max,
@@ -0,0 +1,115 @@
+"""Sized file upload payload for aiohttp multipart requests."""
+
+import asyncio
+from typing import Any
+
+import aiofiles
+from aiohttp import http_writer, payload
+
+# Large reads amortize per-record TLS overhead when sendfile can't be used
+READ_CHUNK_SIZE = 4 * 1024 * 1024
+
+
+class SampleFilePayload(payload.Payload):
+    """
+    Upload payload for a sample file whose size is already known.
+
+    Declaring the size lets aiohttp send the request with a Content-Length
+    instead of chunked transfer encoding. On plain TCP connections the file is
+    handed to the kernel with loop.sendfile() so its bytes never pass through
+    Python buffers; otherwise (TLS, compression, tracing hooks) it is streamed
+    through aiofiles in large chunks.
+    """
+
+    _autoclose = True
+
+    def __init__(self, path: str, size: int, **kwargs: Any):
+        """
+        Initialize the payload.
+
+        Args:
+            path: Path of the file to upload
+            size: File size in bytes
+            **kwargs: Passed through to aiohttp.payload.Payload
+        """
+        super().__init__(path, **kwargs)
+        self._path = path
+        self._size = size
+
+    def decode(self, encoding: str = "utf-8", errors: str = "strict") -> str:
+        """Return the file contents as a string (not used for uploads)."""
+        with open(self._path, "rb") as f:
+            return f.read().decode(encoding, errors)
+
+    async def write(self, writer: Any) -> None:
+        """
+        Write the file contents to the request stream.
+
+        Args:
+            writer: aiohttp stream writer for the request body
+        """
+        if self._can_sendfile(writer) and await self._sendfile(writer):
+            return
+
+        async with aiofiles.open(self._path, "rb") as f:
+            while True:
+                chunk = await f.read(READ_CHUNK_SIZE)
+                if not chunk:
+                    break
+                await writer.write(chunk)
+
+    @staticmethod
+    def _can_sendfile(writer: Any) -> bool:
+        """Check whether the body can bypass the writer and go straight to the socket."""
+        if type(writer) is not http_writer.StreamWriter:
+            # e.g. a multipart writer wrapper applying encodings
+            return False
+
+        # Writer internals differ between aiohttp releases, so any attribute
+        # this relies on that is missing means streaming the file instead.
+        # on_body_write (upload progress) only exists in newer releases; older
+        # ones always set the _on_chunk_sent trace hook, so they stream too.
+        required = ("chunked", "_compress", "_on_chunk_sent", "output_size", "length")
+        if not all(hasattr(writer, name) for name in required):
+            return False
+
+        # Only the stock asyncio loops implement loop.sendfile(); uvloop's
+        # raises NotImplementedError
+        if not isinstance(asyncio.get_running_loop(), asyncio.BaseEventLoop):
+            return False
+
+        transport = writer.transport
+        return (
+            transport is not None
+            and not transport.is_closing()
+            and transport.get_extra_info("sslcontext") is None
+            and not writer.chunked
+            and writer._compress is None
+            and getattr(writer, "on_body_write", None) is None
+            and writer._on_chunk_sent is None
+        )
+
+    async def _sendfile(self, writer: http_writer.StreamWriter) -> bool:
+        """
+        Send the file with loop.sendfile(), keeping the writer's accounting in step.
+
+        Returns:
+            False if the loop turned out not to support sendfile, in which case
+            nothing of the body was sent and the caller streams it instead
+        """
+        # Flush any request headers aiohttp is still holding back
+        await writer.write(b"")
+
+        loop = asyncio.get_running_loop()
+        with open(self._path, "rb") as f:
+            try:
+                sent = await loop.sendfile(writer.transport, f, 0, self._size)
+            except (NotImplementedError, RuntimeError):
+                # Raised before any bytes are sent (RuntimeError covers
+                # asyncio.SendfileNotAvailableError)
+                return False
+
+        writer.output_size += sent
+        if writer.length is not None:
+            writer.length = max(writer.length - sent, 0)
+        return True
@@ -1,11 +1,36 @@
 """Data models for async benchmarking."""
 
+import sys
 from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Optional, List, Dict, Any
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
+# Slotted dataclasses drop the per-instance __dict__; slots= needs Python 3.10
+_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
 
-@dataclass
+
+def _build_to_dict(fields: Tuple[str, ...]) -> Callable[[Any], Dict[str, Any]]:
+    """
+    Build a to_dict method that serializes the given fields.
+
+    The method is generated as a single dict literal, which is as fast as a
+    hand-written one but keeps the field list in one place.
+
+    Args:
+        fields: Attribute names to include, in output order
+
+    Returns:
+        Function suitable for use as a to_dict method
+    """
+    items = ", ".join(f"{name!r}: self.{name}" for name in fields)
+    namespace: Dict[str, Any] = {}
+    exec(f"def to_dict(self):\n    return {{{items}}}\n", namespace)
+    to_dict = namespace["to_dict"]
+    to_dict.__doc__ = "Convert to dictionary for serialization."
+    return to_dict
+
+
+@dataclass(**_SLOTS)
 class AsyncTestConfig:
     """Configuration for an async API load test."""
 
@@ -23,6 +48,7 @@ class AsyncTestConfig:
     # Timeouts
     job_timeout_seconds: int = 1200
     poll_interval_seconds: int = 5
+    poll_interval_max_seconds: int = 30
 
     # SSL
     insecure_ssl: bool = False
@@ -33,7 +59,7 @@ class AsyncTestConfig:
         return self.concurrency == 1
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class JobResult:
     """Result from a single job submission and completion."""
 
@@ -42,7 +68,7 @@ class JobResult:
     file_count: int
     file_size_bytes: int
 
-    # Timing
+    # Timing (time.monotonic() readings, only meaningful relative to each other)
     submit_start: float
     submit_end: float
     submit_latency_ms: float
@@ -59,23 +85,21 @@ class JobResult:
     success: bool
     error_message: Optional[str] = None
 
-    def to_dict(self) -> Dict[str, Any]:
-        """Convert to dictionary for serialization."""
-        return {
-            "job_id": self.job_id,
-            "batch_id": self.batch_id,
-            "file_count": self.file_count,
-            "file_size_bytes": self.file_size_bytes,
-            "submit_latency_ms": self.submit_latency_ms,
-            "job_duration_seconds": self.job_duration_seconds,
-            "poll_count": self.poll_count,
-            "final_state": self.final_state,
-            "success": self.success,
-            "error_message": self.error_message,
-        }
-
-
-@dataclass
+    to_dict = _build_to_dict((
+        "job_id",
+        "batch_id",
+        "file_count",
+        "file_size_bytes",
+        "submit_latency_ms",
+        "job_duration_seconds",
+        "poll_count",
+        "final_state",
+        "success",
+        "error_message",
+    ))
+
+
+@dataclass(**_SLOTS)
 class AsyncTestResult:
     """Results from an async API load test."""
 
@@ -126,39 +150,37 @@ class AsyncTestResult:
     # Raw data for debugging
     raw_job_results: Optional[List[JobResult]] = field(default=None, repr=False)
 
-    def to_dict(self) -> Dict[str, Any]:
-        """Convert to dictionary for serialization."""
-        return {
-            "samples_dir": self.samples_dir,
-            "file_size_label": self.file_size_label,
-            "file_size_bytes": self.file_size_bytes,
-            "files_per_request": self.files_per_request,
-            "concurrency": self.concurrency,
-            "total_files": self.total_files,
-            "total_jobs": self.total_jobs,
-            "successful_jobs": self.successful_jobs,
-            "failed_jobs": self.failed_jobs,
-            "timed_out_jobs": self.timed_out_jobs,
-            "submit_avg_ms": self.submit_avg_ms,
-            "submit_min_ms": self.submit_min_ms,
-            "submit_max_ms": self.submit_max_ms,
-            "submit_p95_ms": self.submit_p95_ms,
-            "submit_p99_ms": self.submit_p99_ms,
-            "job_avg_seconds": self.job_avg_seconds,
-            "job_min_seconds": self.job_min_seconds,
-            "job_max_seconds": self.job_max_seconds,
-            "job_p95_seconds": self.job_p95_seconds,
-            "job_p99_seconds": self.job_p99_seconds,
-            "avg_poll_count": self.avg_poll_count,
-            "total_polls": self.total_polls,
-            "throughput_files_per_second": self.throughput_files_per_second,
-            "throughput_mb_per_second": self.throughput_mb_per_second,
-            "error_rate": self.error_rate,
-            "total_duration_seconds": self.total_duration_seconds,
-        }
-
-
-@dataclass
+    to_dict = _build_to_dict((
+        "samples_dir",
+        "file_size_label",
+        "file_size_bytes",
+        "files_per_request",
+        "concurrency",
+        "total_files",
+        "total_jobs",
+        "successful_jobs",
+        "failed_jobs",
+        "timed_out_jobs",
+        "submit_avg_ms",
+        "submit_min_ms",
+        "submit_max_ms",
+        "submit_p95_ms",
+        "submit_p99_ms",
+        "job_avg_seconds",
+        "job_min_seconds",
+        "job_max_seconds",
+        "job_p95_seconds",
+        "job_p99_seconds",
+        "avg_poll_count",
+        "total_polls",
+        "throughput_files_per_second",
+        "throughput_mb_per_second",
+        "error_rate",
+        "total_duration_seconds",
+    ))
+
+
+@dataclass(**_SLOTS)
 class SweepResult:
     """Results from a multi-directory sweep."""
 
@@ -1,8 +1,21 @@
 """Sample file loading utilities for async benchmarking."""
 
+import itertools
 import os
+import re
 from pathlib import Path
-from typing import List, Tuple
+from typing import Iterator, List, Tuple
+
+# Numeric part and optional unit of a size label such as "100K" or "1.5 GB"
+_SIZE_LABEL_RE = re.compile(r"([\d.]+)\s*([KMGT]?B?)", re.IGNORECASE)
+
+_SIZE_UNIT_MULTIPLIERS = {
+    "": 1,
+    "K": 1024,
+    "M": 1024 * 1024,
+    "G": 1024 * 1024 * 1024,
+    "T": 1024 * 1024 * 1024 * 1024,
+}
 
 
 class SampleLoader:
@@ -18,14 +31,20 @@ class SampleLoader:
         """
         self.samples_dir = Path(samples_dir)
         self.repeat = max(repeat, 1)
-        self.files: List[Tuple[str, str]] = []
+        # Distinct files in the directory; repeats are generated on iteration
+        self.files: List[Tuple[str, str, str, int]] = []
 
-    def load(self) -> List[Tuple[str, str]]:
+    def load(self) -> Iterator[Tuple[str, str, str, int]]:
         """
-        Load file paths from the samples directory.
+        Load file paths and sizes from the samples directory.
+
+        Sizes and filename parts are computed once here so callers don't need
+        to stat files or split names again for every batch.
 
         Returns:
-            List of (filename, filepath) tuples
+            Iterator over (base_name, extension, filepath, size_bytes) tuples,
+            yielding the directory's files `repeat` times over without
+            materializing the repeated list
         """
         if not self.samples_dir.exists():
             raise FileNotFoundError(f"Samples directory not found: {self.samples_dir}")
@@ -33,17 +52,22 @@ class SampleLoader:
         if not self.samples_dir.is_dir():
             raise NotADirectoryError(f"Path is not a directory: {self.samples_dir}")
 
+        # scandir reports the file type from the directory listing itself, so
+        # only the size lookup needs a stat() per file
+        with os.scandir(self.samples_dir) as it:
+            entries = sorted((e for e in it if e.is_file()), key=lambda e: e.name)
+
         files = []
-        for f in sorted(self.samples_dir.iterdir()):
-            if f.is_file():
-                files.append((f.name, str(f)))
+        for entry in entries:
+            base, ext = os.path.splitext(entry.name)
+            files.append((base, ext, entry.path, entry.stat().st_size))
 
         if not files:
             raise ValueError(f"No files found in: {self.samples_dir}")
 
+        self.files = files
         # Repeat files if requested
-        self.files = files * self.repeat
-        return self.files
+        return itertools.chain.from_iterable(itertools.repeat(files, self.repeat))
 
     def get_file_size(self) -> int:
         """
@@ -56,12 +80,12 @@ class SampleLoader:
             self.load()
 
         if self.files:
-            return os.path.getsize(self.files[0][1])
+            return self.files[0][3]
         return 0
 
     def get_total_size(self) -> int:
         """
-        Get total size of all loaded files.
+        Get total size of all loaded files, including repeats.
 
         Returns:
             Total size in bytes
@@ -69,10 +93,7 @@ class SampleLoader:
         if not self.files:
             self.load()
 
-        total = 0
-        for _, filepath in self.files:
-            total += os.path.getsize(filepath)
-        return total
+        return sum(size for _, _, _, size in self.files) * self.repeat
 
     def extract_size_label(self) -> str:
         """
@@ -89,8 +110,8 @@ class SampleLoader:
         return self.samples_dir.name
 
     def __len__(self) -> int:
-        """Return number of loaded files."""
-        return len(self.files)
+        """Return number of loaded files, including repeats."""
+        return len(self.files) * self.repeat
 
 
 def format_bytes(size_bytes: int) -> str:
@@ -123,30 +144,10 @@ def parse_size_label(label: str) -> int:
     Returns:
         Size in bytes
     """
-    label = label.upper().strip()
-
-    # Extract numeric part and unit
-    numeric = ""
-    unit = ""
-    for char in label:
-        if char.isdigit() or char == ".":
-            numeric += char
-        else:
-            unit += char
-
-    if not numeric:
+    match = _SIZE_LABEL_RE.match(label.strip())
+    if not match:
         return 0
 
-    value = float(numeric)
-
-    # Convert based on unit
-    if unit in ("K", "KB"):
-        return int(value * 1024)
-    elif unit in ("M", "MB"):
-        return int(value * 1024 * 1024)
-    elif unit in ("G", "GB"):
-        return int(value * 1024 * 1024 * 1024)
-    elif unit in ("T", "TB"):
-        return int(value * 1024 * 1024 * 1024 * 1024)
-    else:
-        return int(value)
+    value = float(match.group(1))
+    unit = match.group(2).upper().rstrip("B")
+    return int(value * _SIZE_UNIT_MULTIPLIERS[unit])
@@ -17,21 +17,33 @@ import os
 import sys
 from pathlib import Path
 
+# Size of the repeated block written by generate_file
+TEMPLATE_SIZE = 1024 * 1024
+
+# Targets at least this large are filled with in-kernel copies where supported
+FAST_COPY_THRESHOLD = 100 * 1024 * 1024
+
+# Targets at least this large that are written normally get their full size
+# allocated up front
+PREALLOCATE_THRESHOLD = 64 * 1024 * 1024
+
+# Size suffixes accepted by parse_size, longest first so a shorter suffix
+# can never shadow a longer one that ends with it
+_SIZE_SUFFIXES = (
+    ('KB', 1024),
+    ('MB', 1024 ** 2),
+    ('GB', 1024 ** 3),
+    ('K', 1024),
+    ('M', 1024 ** 2),
+    ('G', 1024 ** 3),
+)
+
 
 def parse_size(size_str: str) -> int:
     """Parse a size string like '1K', '10M', '1G' into bytes."""
     size_str = size_str.strip().upper()
 
-    multipliers = {
-        'K': 1024,
-        'KB': 1024,
-        'M': 1024 ** 2,
-        'MB': 1024 ** 2,
-        'G': 1024 ** 3,
-        'GB': 1024 ** 3,
-    }
-
-    for suffix, multiplier in multipliers.items():
+    for suffix, multiplier in _SIZE_SUFFIXES:
         if size_str.endswith(suffix):
             number_part = size_str[:-len(suffix)]
             try:
@@ -48,72 +60,135 @@ def parse_size(size_str: str) -> int:
 
 def generate_file(source_path: Path, target_path: Path, target_size: int) -> int:
     """
-    Generate a file of the target size by repeating lines from the source file.
+    Generate a file of the target size by repeating the source file's content.
 
     Returns the actual size of the generated file.
     """
-    # Read source file lines
-    with open(source_path, 'r', encoding='utf-8') as f:
-        lines = f.readlines()
-
-    if not lines:
+    # Read the source as bytes; only non-ASCII sources need decoding, to
+    # reject invalid UTF-8
+    raw = source_path.read_bytes()
+    if not raw:
         raise ValueError(f"Source file is empty: {source_path}")
+    is_ascii = raw.isascii()
+    if not is_ascii:
+        raw.decode('utf-8')
 
-    # Ensure lines have newline endings for consistent output
-    lines = [line if line.endswith('\n') else line + '\n' for line in lines]
+    # Normalize line endings and ensure the last line ends with a newline,
+    # for consistent output
+    if b'\r' in raw:
+        raw = raw.replace(b'\r\n', b'\n').replace(b'\r', b'\n')
+    if not raw.endswith(b'\n'):
+        raw += b'\n'
 
     # Create target directory if it doesn't exist
     target_path.parent.mkdir(parents=True, exist_ok=True)
 
-    # Write repeated content until we reach target size
+    # Repeat whole copies of the source into a ~1 MiB block, so the bulk of
+    # the file is written a block at a time. Small targets only need enough
+    # copies to cover the target, which they get in a single write.
+    copies = min(TEMPLATE_SIZE // len(raw), target_size // len(raw) + 1)
+    template = raw * max(1, copies)
+    template_view = memoryview(template)
+
+    # Whole blocks, then a tail that is a prefix of the block (the block ends
+    # on a source boundary), cut back so no multi-byte character is split
+    block_count = target_size // len(template)
+    tail_size = target_size - block_count * len(template)
+    if tail_size and not is_ascii:
+        tail_size = utf8_cut(template, tail_size)
+
     bytes_written = 0
-    line_index = 0
-
-    with open(target_path, 'w', encoding='utf-8') as f:
-        while bytes_written < target_size:
-            line = lines[line_index % len(lines)]
-            line_bytes = line.encode('utf-8')
-            line_size = len(line_bytes)
-
-            remaining = target_size - bytes_written
-
-            if line_size <= remaining:
-                # Write the full line
-                f.write(line)
-                bytes_written += line_size
-            else:
-                # Truncate the line to fit remaining space
-                # Decode partial bytes carefully to avoid breaking multi-byte characters
-                truncated = truncate_to_bytes(line, remaining)
-                if truncated:
-                    f.write(truncated)
-                    bytes_written += len(truncated.encode('utf-8'))
-                break
-
-            line_index += 1
+
+    # Opened for reading too, as copy_file_range reads back from the same file
+    with open(target_path, 'w+b') as f:
+        if target_size >= FAST_COPY_THRESHOLD and copy_blocks_in_kernel(f, template, block_count):
+            bytes_written = block_count * len(template)
+        elif target_size >= PREALLOCATE_THRESHOLD:
+            preallocate(f.fileno(), block_count * len(template) + tail_size)
+
+        while bytes_written + len(template) <= target_size:
+            f.write(template_view)
+            bytes_written += len(template)
+
+        if tail_size:
+            f.write(template_view[:tail_size])
+            bytes_written += tail_size
 
     return bytes_written
 
 
-def truncate_to_bytes(text: str, max_bytes: int) -> str:
+def copy_blocks_in_kernel(f, template: bytes, block_count: int) -> bool:
+    """
+    Fill the start of an empty file with block_count copies of template.
+    The file must be open for both reading and writing.
+
+    Writes the template once, then uses os.copy_file_range to copy the
+    already-written region onto the end of itself, doubling it each pass, so
+    the data never passes through user space. Leaves the file positioned
+    after the copied blocks.
+
+    Returns False, with the file left empty, if the platform or filesystem
+    doesn't support in-kernel copies; the caller should then write normally.
     """
-    Truncate a string to fit within max_bytes when encoded as UTF-8.
-    Ensures we don't break multi-byte characters.
+    if not hasattr(os, 'copy_file_range') or block_count < 2:
+        return False
+
+    total = len(template) * block_count
+    f.write(template)
+    f.flush()
+    fd = f.fileno()
+
+    preallocate(fd, total)
+
+    try:
+        written = len(template)
+        while written < total:
+            count = min(written, total - written)
+            copied = 0
+            while copied < count:
+                n = os.copy_file_range(fd, fd, count - copied, copied, written + copied)
+                if n == 0:
+                    raise OSError('copy_file_range made no progress')
+                copied += n
+            written += count
+    except OSError:
+        f.seek(0)
+        f.truncate()
+        return False
+
+    f.seek(total)
+    return True
+
+
+def preallocate(fd: int, size: int) -> None:
+    """
+    Allocate size bytes for a file up front, where the platform supports it.
+
+    Keeps a large file's extents contiguous. Best effort: errors, including
+    unsupported filesystems, are ignored.
     """
-    encoded = text.encode('utf-8')
-    if len(encoded) <= max_bytes:
-        return text
-
-    # Binary search for the right character count
-    low, high = 0, len(text)
-    while low < high:
-        mid = (low + high + 1) // 2
-        if len(text[:mid].encode('utf-8')) <= max_bytes:
-            low = mid
-        else:
-            high = mid - 1
-
-    return text[:low]
+    if hasattr(os, 'posix_fallocate'):
+        try:
+            os.posix_fallocate(fd, 0, size)
+        except OSError:
+            pass
+
+
+def utf8_cut(data: bytes, max_bytes: int) -> int:
+    """
+    Return the largest index <= max_bytes at which UTF-8 encoded data can be
+    cut without breaking a multi-byte character.
+    """
+    if len(data) <= max_bytes:
+        return len(data)
+
+    # Back up from the cut to the start of a character: UTF-8 continuation
+    # bytes look like 10xxxxxx, and a character has at most 3 of them
+    cut = max_bytes
+    while cut > 0 and (data[cut] & 0xC0) == 0x80:
+        cut -= 1
+
+    return cut
 
 
 def format_size(size_bytes: int) -> str:
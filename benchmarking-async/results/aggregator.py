@@ -1,7 +1,7 @@
 """Result aggregation and reporting for async benchmarking."""
 
-import pandas as pd
-from typing import List, Optional
+import sys
+from typing import TYPE_CHECKING, List, Optional
 
 # Support both relative and absolute imports
 try:
@@ -9,66 +9,147 @@ try:
 except (ImportError, ValueError):
     from core.models import AsyncTestResult
 
+if TYPE_CHECKING:
+    import pandas as pd
+
+# Banner rules for the summary table and the detailed single-test report
+_TABLE_RULE = "=" * 120
+_TABLE_DIVIDER = "-" * 120
+_REPORT_RULE = "=" * 60
+_REPORT_SECTION_RULE = "-" * 30
+
+# Precision used for every float column in tables and exports
+FLOAT_FORMAT = "%.3f"
+
+# Summary columns: (header, AsyncTestResult attribute, divisor, kind)
+_COLUMNS = (
+    ("Size", "file_size_label", 1, "label"),
+    ("Size_MB", "file_size_bytes", 1024 * 1024, "float"),
+    ("Files", "total_files", 1, "int"),
+    ("Batch", "files_per_request", 1, "int"),
+    ("Jobs", "total_jobs", 1, "int"),
+    ("Success", "successful_jobs", 1, "int"),
+    ("Failed", "failed_jobs", 1, "int"),
+    ("Timeout", "timed_out_jobs", 1, "int"),
+    ("Error%", "error_rate", 1, "float"),
+    # Submit latency is converted from ms to seconds
+    ("Upload_s", "submit_avg_ms", 1000, "float"),
+    ("Upload_P95", "submit_p95_ms", 1000, "float"),
+    ("Job_s", "job_avg_seconds", 1, "float"),
+    ("Job_P95", "job_p95_seconds", 1, "float"),
+    ("Files/s", "throughput_files_per_second", 1, "float"),
+    ("MB/s", "throughput_mb_per_second", 1, "float"),
+)
+
+
+def _format_cell(value, divisor: int, kind: str) -> str:
+    """Format one summary value for TSV and console output."""
+    if kind == "float":
+        return FLOAT_FORMAT % (value / divisor)
+    return str(value)
+
+
+def _format_row(result: AsyncTestResult) -> List[str]:
+    """Format one result as summary cells, in _COLUMNS order."""
+    return [_format_cell(getattr(result, attr), divisor, kind) for _, attr, divisor, kind in _COLUMNS]
+
 
 class AsyncResultAggregator:
     """Aggregates and formats async test results for export."""
 
     def __init__(self):
         self.results: List[AsyncTestResult] = []
+        # DataFrame built from self.results; reset whenever results change
+        self._df_cache: Optional["pd.DataFrame"] = None
 
     def add_result(self, result: AsyncTestResult) -> None:
         """Add a single test result."""
         self.results.append(result)
+        self._df_cache = None
 
     def add_results(self, results: List[AsyncTestResult]) -> None:
         """Add multiple test results."""
         self.results.extend(results)
+        self._df_cache = None
 
     def clear(self) -> None:
         """Clear all results."""
         self.results = []
+        self._df_cache = None
+
+    def to_dataframe(self) -> "pd.DataFrame":
+        """
+        Convert results to pandas DataFrame with file-size-specific columns.
+
+        The frame is cached until results are added or cleared, so callers
+        must not modify it in place.
+
+        Returns:
+            DataFrame with one row per result
+        """
+        if self._df_cache is None:
+            self._df_cache = self._build_dataframe()
+        return self._df_cache
 
-    def to_dataframe(self) -> pd.DataFrame:
-        """Convert results to pandas DataFrame with file-size-specific columns."""
-        data = []
-        for r in self.results:
-            size_mb = r.file_size_bytes / (1024 * 1024)
-            # Convert submit latency from ms to seconds
-            upload_avg_s = r.submit_avg_ms / 1000
-            upload_p95_s = r.submit_p95_ms / 1000
-            data.append({
-                "Size": r.file_size_label,
-                "Size_MB": f"{size_mb:.3f}",
-                "Files": r.total_files,
-                "Batch": r.files_per_request,
-                "Jobs": r.total_jobs,
-                "Success": r.successful_jobs,
-                "Failed": r.failed_jobs,
-                "Timeout": r.timed_out_jobs,
-                "Error%": f"{r.error_rate:.3f}",
-                "Upload_s": f"{upload_avg_s:.3f}",
-                "Upload_P95": f"{upload_p95_s:.3f}",
-                "Job_s": f"{r.job_avg_seconds:.3f}",
-                "Job_P95": f"{r.job_p95_seconds:.3f}",
-                "Files/s": f"{r.throughput_files_per_second:.3f}",
-                "MB/s": f"{r.throughput_mb_per_second:.3f}",
-            })
-        return pd.DataFrame(data)
+    def _build_dataframe(self) -> "pd.DataFrame":
+        """
+        Build the results DataFrame.
+
+        Columns are built whole and kept numeric; FLOAT_FORMAT is applied only
+        when the frame is exported. pandas and numpy are imported here so the
+        console and TSV paths never load them.
+        """
+        import numpy as np
+        import pandas as pd
+
+        results = self.results
+        columns = {}
+        for header, attr, divisor, kind in _COLUMNS:
+            values = (getattr(r, attr) for r in results)
+            if kind == "label":
+                columns[header] = list(values)
+            elif kind == "int":
+                columns[header] = np.fromiter(values, dtype=np.int64, count=len(results))
+            else:
+                columns[header] = np.fromiter(values, dtype=np.float64, count=len(results)) / divisor
+        return pd.DataFrame(columns)
 
     def to_csv(self, path: str) -> None:
         """Export to CSV file."""
         df = self.to_dataframe()
-        df.to_csv(path, index=False)
+        df.to_csv(path, index=False, float_format=FLOAT_FORMAT)
 
     def to_tsv(self, path: str) -> None:
         """Export to TSV file."""
-        df = self.to_dataframe()
-        df.to_csv(path, sep="\t", index=False)
+        with open(path, "w") as f:
+            f.write(self.get_tsv_string())
 
     def get_tsv_string(self) -> str:
-        """Get results as TSV string for easy copy/paste to spreadsheet."""
-        df = self.to_dataframe()
-        return df.to_csv(sep="\t", index=False)
+        """
+        Get results as TSV string for easy copy/paste to spreadsheet.
+
+        Written straight from the results rather than through pandas, which
+        adds nothing for plain tab-separated rows.
+        """
+        lines = ["\t".join(header for header, _, _, _ in _COLUMNS)]
+        lines.extend("\t".join(_format_row(r)) for r in self.results)
+        return "\n".join(lines) + "\n"
+
+    def _format_table(self) -> str:
+        """
+        Format results as a console table with right-aligned columns.
+
+        Matches the layout of DataFrame.to_string(index=False) without
+        loading pandas.
+        """
+        # pandas pads integer headers by one space, reserving room for a sign
+        headers = [" " + header if kind == "int" else header for header, _, _, kind in _COLUMNS]
+        rows = [_format_row(r) for r in self.results]
+        widths = [max(len(cell) for cell in column) for column in zip(headers, *rows)]
+        return "\n".join(
+            " ".join(cell.rjust(width) for cell, width in zip(row, widths))
+            for row in [headers, *rows]
+        )
 
     def print_summary_table(
         self,
@@ -81,88 +162,100 @@ class AsyncResultAggregator:
             return
 
         print()
-        print("=" * 120)
-        if title:
-            print(title.center(120))
-        else:
-            print("ASYNC BENCHMARK RESULTS SUMMARY".center(120))
-        print("=" * 120)
+        print(_TABLE_RULE)
+        print((title or "ASYNC BENCHMARK RESULTS SUMMARY").center(120))
+        print(_TABLE_RULE)
 
         if description:
             print(description)
-            print("-" * 120)
+            print(_TABLE_DIVIDER)
 
-        # Print the formatted table
-        df = self.to_dataframe()
-        print(df.to_string(index=False))
+        print(self._format_table())
 
         print()
-        print("=" * 120)
+        print(_TABLE_RULE)
         print("TSV OUTPUT (copy to spreadsheet):")
-        print("=" * 120)
+        print(_TABLE_RULE)
         print(self.get_tsv_string())
-        print("=" * 120)
+        print(_TABLE_RULE)
+
+    @staticmethod
+    def print_single_result(result: AsyncTestResult) -> None:
+        """
+        Print a single test result during sweep.
 
-    def print_single_result(self, result: AsyncTestResult) -> None:
-        """Print a single test result during sweep."""
+        Called after every sweep stage, so it formats only the given result
+        and never touches the aggregated results or their DataFrame.
+        """
         upload_avg_s = result.submit_avg_ms / 1000
         upload_p95_s = result.submit_p95_ms / 1000
-        print(f"\nResults for {result.file_size_label} ({result.samples_dir}):")
-        print(f"  Files: {result.total_files} ({result.files_per_request} per request)")
-        print(f"  Jobs: {result.successful_jobs}/{result.total_jobs} succeeded")
-        print(f"  Upload: avg={upload_avg_s:.3f}s, p95={upload_p95_s:.3f}s")
-        print(f"  Job Duration: avg={result.job_avg_seconds:.3f}s, p95={result.job_p95_seconds:.3f}s")
-        print(f"  Throughput: {result.throughput_files_per_second:.3f} files/s, {result.throughput_mb_per_second:.3f} MB/s")
-        print(f"  Error Rate: {result.error_rate:.3f}%")
+        sys.stdout.write(
+            f"\nResults for {result.file_size_label} ({result.samples_dir}):\n"
+            f"  Files: {result.total_files} ({result.files_per_request} per request)\n"
+            f"  Jobs: {result.successful_jobs}/{result.total_jobs} succeeded\n"
+            f"  Upload: avg={upload_avg_s:.3f}s, p95={upload_p95_s:.3f}s\n"
+            f"  Job Duration: avg={result.job_avg_seconds:.3f}s, p95={result.job_p95_seconds:.3f}s\n"
+            f"  Throughput: {result.throughput_files_per_second:.3f} files/s, "
+            f"{result.throughput_mb_per_second:.3f} MB/s\n"
+            f"  Error Rate: {result.error_rate:.3f}%\n"
+        )
 
     def print_detailed_result(self, result: AsyncTestResult) -> None:
         """Print detailed single test result."""
-        print()
-        print("=" * 60)
-        print("ASYNC LOAD TEST RESULTS")
-        print("=" * 60)
-
-        print(f"\nTEST CONFIGURATION")
-        print("-" * 30)
-        print(f"Samples Directory:   {result.samples_dir}")
-        print(f"File Size:           {result.file_size_label} ({result.file_size_bytes} bytes)")
-        print(f"Files per Request:   {result.files_per_request}")
-        print(f"Concurrency:         {result.concurrency}")
-
-        print(f"\nJOB STATISTICS")
-        print("-" * 30)
-        print(f"Total Files:         {result.total_files}")
-        print(f"Total Jobs:          {result.total_jobs}")
-        print(f"Successful Jobs:     {result.successful_jobs}")
-        print(f"Failed Jobs:         {result.failed_jobs}")
-        print(f"Timed Out Jobs:      {result.timed_out_jobs}")
-        print(f"Error Rate:          {result.error_rate:.3f}%")
-
-        print(f"\nUPLOAD TIME (seconds)")
-        print("-" * 30)
-        print(f"Average:             {result.submit_avg_ms / 1000:.3f}")
-        print(f"Minimum:             {result.submit_min_ms / 1000:.3f}")
-        print(f"Maximum:             {result.submit_max_ms / 1000:.3f}")
-        print(f"95th Percentile:     {result.submit_p95_ms / 1000:.3f}")
-        print(f"99th Percentile:     {result.submit_p99_ms / 1000:.3f}")
-
-        print(f"\nJOB DURATION (seconds)")
-        print("-" * 30)
-        print(f"Average:             {result.job_avg_seconds:.3f}")
-        print(f"Minimum:             {result.job_min_seconds:.3f}")
-        print(f"Maximum:             {result.job_max_seconds:.3f}")
-        print(f"95th Percentile:     {result.job_p95_seconds:.3f}")
-        print(f"99th Percentile:     {result.job_p99_seconds:.3f}")
-
-        print(f"\nPOLLING STATISTICS")
-        print("-" * 30)
-        print(f"Average Polls/Job:   {result.avg_poll_count:.1f}")
-        print(f"Total Polls:         {result.total_polls}")
-
-        print(f"\nTHROUGHPUT")
-        print("-" * 30)
-        print(f"Files/Second:        {result.throughput_files_per_second:.3f}")
-        print(f"MB/Second:           {result.throughput_mb_per_second:.3f}")
-        print(f"Total Duration:      {result.total_duration_seconds:.3f}s")
-
-        print("=" * 60)
+        # Submit latencies are reported in seconds
+        submit_avg = result.submit_avg_ms / 1000
+        submit_min = result.submit_min_ms / 1000
+        submit_max = result.submit_max_ms / 1000
+        submit_p95 = result.submit_p95_ms / 1000
+        submit_p99 = result.submit_p99_ms / 1000
+
+        # Built as one string so the report goes out in a single write
+        sys.stdout.write(f"""
+{_REPORT_RULE}
+ASYNC LOAD TEST RESULTS
+{_REPORT_RULE}
+
+TEST CONFIGURATION
+{_REPORT_SECTION_RULE}
+Samples Directory:   {result.samples_dir}
+File Size:           {result.file_size_label} ({result.file_size_bytes} bytes)
+Files per Request:   {result.files_per_request}
+Concurrency:         {result.concurrency}
+
+JOB STATISTICS
+{_REPORT_SECTION_RULE}
+Total Files:         {result.total_files}
+Total Jobs:          {result.total_jobs}
+Successful Jobs:     {result.successful_jobs}
+Failed Jobs:         {result.failed_jobs}
+Timed Out Jobs:      {result.timed_out_jobs}
+Error Rate:          {result.error_rate:.3f}%
+
+UPLOAD TIME (seconds)
+{_REPORT_SECTION_RULE}
+Average:             {submit_avg:.3f}
+Minimum:             {submit_min:.3f}
+Maximum:             {submit_max:.3f}
+95th Percentile:     {submit_p95:.3f}
+99th Percentile:     {submit_p99:.3f}
+
+JOB DURATION (seconds)
+{_REPORT_SECTION_RULE}
+Average:             {result.job_avg_seconds:.3f}
+Minimum:             {result.job_min_seconds:.3f}
+Maximum:             {result.job_max_seconds:.3f}
+95th Percentile:     {result.job_p95_seconds:.3f}
+99th Percentile:     {result.job_p99_seconds:.3f}
+
+POLLING STATISTICS
+{_REPORT_SECTION_RULE}
+Average Polls/Job:   {result.avg_poll_count:.1f}
+Total Polls:         {result.total_polls}
+
+THROUGHPUT
+{_REPORT_SECTION_RULE}
+Files/Second:        {result.throughput_files_per_second:.3f}
+MB/Second:           {result.throughput_mb_per_second:.3f}
+Total Duration:      {result.total_duration_seconds:.3f}s
+{_REPORT_RULE}
+""")
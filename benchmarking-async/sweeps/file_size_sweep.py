@@ -2,6 +2,7 @@
 
 import asyncio
 import logging
+from dataclasses import replace
 from datetime import datetime
 from typing import List, Optional
 
@@ -15,6 +16,11 @@ except (ImportError, ValueError):
     from core.async_tester import AsyncTester
     from results.aggregator import AsyncResultAggregator
 
+# Banner pieces, built once rather than per log call
+_SWEEP_RULE = "=" * 80
+_STAGE_RULE = "=" * 60
+_SWEEP_BANNER = f"\n{_SWEEP_RULE}\n{'FILE SIZE SWEEP - ASYNC API BENCHMARK'.center(80)}\n{_SWEEP_RULE}"
+
 
 class FileSizeSweep:
     """Orchestrates tests across multiple file size directories."""
@@ -42,78 +48,130 @@ class FileSizeSweep:
         if self.verbose:
             print(message)
 
+    async def _run_stage(
+        self,
+        stage_num: int,
+        total_stages: int,
+        directory: str,
+        files_per_request: int,
+        concurrency: int,
+        repeat: int,
+        quiet_progress: bool = False,
+    ) -> Optional[AsyncTestResult]:
+        """
+        Run a single sweep stage against one directory.
+
+        Args:
+            quiet_progress: Suppress the tester's per-batch progress output,
+                e.g. when other stages are printing at the same time
+
+        Returns:
+            AsyncTestResult for the stage, or None if the stage failed
+        """
+        self._log(f"\n{_STAGE_RULE}\nStage {stage_num}/{total_stages}: {directory}\n{_STAGE_RULE}")
+
+        # Create stage-specific config
+        stage_config = replace(
+            self.base_config,
+            samples_dir=directory,
+            files_per_request=files_per_request,
+            concurrency=concurrency,
+            repeat=repeat,
+        )
+
+        try:
+            tester = AsyncTester(stage_config, verbose=self.verbose and not quiet_progress)
+            result = await tester.run()
+            self.aggregator.add_result(result)
+
+            # Print intermediate result
+            self.aggregator.print_single_result(result)
+            return result
+
+        except Exception as e:
+            self._log(f"\nError in stage {stage_num}: {e}")
+            self.logger.exception(f"Error processing directory {directory}")
+            return None
+
     async def run(
         self,
         directories: List[str],
         files_per_request: int = 1,
         concurrency: int = 1,
         repeat: int = 1,
+        pipeline_depth: int = 1,
     ) -> SweepResult:
         """
-        Run sweep through all directories sequentially.
+        Run sweep through all directories.
+
+        With pipeline_depth=1 stages run strictly one after another. Larger
+        values start up to pipeline_depth stages at once (in directory order),
+        so a new stage can upload while earlier stages are still polling.
 
         Args:
             directories: List of directories to test (in order)
             files_per_request: Files per API request batch
             concurrency: Parallel requests (1 = sequential)
             repeat: Repeat sample files N times
+            pipeline_depth: Maximum number of stages running at once
 
         Returns:
             SweepResult with all stage results
         """
         self.aggregator.clear()
-        stage_results: List[AsyncTestResult] = []
+        pipeline_depth = max(pipeline_depth, 1)
         start_time = datetime.now()
 
-        self._log(f"\n{'=' * 80}")
-        self._log("FILE SIZE SWEEP - ASYNC API BENCHMARK".center(80))
-        self._log(f"{'=' * 80}")
+        self._log(_SWEEP_BANNER)
         self._log(f"\nDirectories to test: {len(directories)}")
         for i, d in enumerate(directories, 1):
             self._log(f"  {i}. {d}")
         self._log(f"\nFiles per request: {files_per_request}")
         self._log(f"Concurrency: {concurrency}")
         self._log(f"Repeat: {repeat}x")
-        self._log(f"{'=' * 80}\n")
-
-        for i, directory in enumerate(directories, 1):
-            self._log(f"\n{'=' * 60}")
-            self._log(f"Stage {i}/{len(directories)}: {directory}")
-            self._log(f"{'=' * 60}")
-
-            # Create stage-specific config
-            stage_config = AsyncTestConfig(
-                server_url=self.base_config.server_url,
-                datasource_id=self.base_config.datasource_id,
-                api_token=self.base_config.api_token,
-                samples_dir=directory,
-                files_per_request=files_per_request,
-                concurrency=concurrency,
-                repeat=repeat,
-                job_timeout_seconds=self.base_config.job_timeout_seconds,
-                poll_interval_seconds=self.base_config.poll_interval_seconds,
-                insecure_ssl=self.base_config.insecure_ssl,
+        if pipeline_depth > 1:
+            self._log(f"Pipeline depth: {pipeline_depth} stages")
+            self._log(
+                "Warning: overlapping stages share the server, so per-stage "
+                "latency and throughput are not comparable to a sequential sweep"
             )
-
-            try:
-                tester = AsyncTester(stage_config, verbose=self.verbose)
-                result = await tester.run()
-                stage_results.append(result)
-                self.aggregator.add_result(result)
-
-                # Print intermediate result
-                self.aggregator.print_single_result(result)
-
-            except Exception as e:
-                self._log(f"\nError in stage {i}: {e}")
-                self.logger.exception(f"Error processing directory {directory}")
-                # Continue with next directory
+        self._log(f"{_SWEEP_RULE}\n")
+
+        if pipeline_depth == 1:
+            stage_outcomes = []
+            for i, directory in enumerate(directories, 1):
+                stage_outcomes.append(await self._run_stage(
+                    i, len(directories), directory, files_per_request, concurrency, repeat,
+                ))
+        else:
+            # Stages are created in order and the semaphore wakes waiters FIFO,
+            # so stages still start in directory order. Per-batch progress from
+            # overlapping stages would interleave, so only stage banners and
+            # results are printed.
+            semaphore = asyncio.Semaphore(pipeline_depth)
+
+            async def pipelined_stage(i: int, directory: str) -> Optional[AsyncTestResult]:
+                async with semaphore:
+                    return await self._run_stage(
+                        i, len(directories), directory, files_per_request, concurrency, repeat,
+                        quiet_progress=True,
+                    )
+
+            stage_outcomes = await asyncio.gather(*(
+                pipelined_stage(i, directory)
+                for i, directory in enumerate(directories, 1)
+            ))
+
+        # Keep stage results in directory order regardless of completion order
+        stage_results: List[AsyncTestResult] = [r for r in stage_outcomes if r is not None]
+        self.aggregator.clear()
+        self.aggregator.add_results(stage_results)
 
         end_time = datetime.now()
         total_duration = (end_time - start_time).total_seconds()
 
         # Print final summary
-        self._log(f"\n{'=' * 80}")
+        self._log(f"\n{_SWEEP_RULE}")
         self.aggregator.print_summary_table(title="FILE SIZE SWEEP RESULTS")
 
         # Calculate aggregates
@@ -0,0 +1,82 @@
+"""Tests for SampleFilePayload uploads on the supported event loops."""
+
+import asyncio
+import os
+import sys
+import tempfile
+import unittest
+
+import aiohttp
+from aiohttp import web
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from core.file_payload import SampleFilePayload  # noqa: E402
+
+try:
+    import uvloop
+except ImportError:
+    uvloop = None
+
+
+async def _upload(path: str) -> bytes:
+    """Upload path to a local server and return the body it received."""
+    received = []
+
+    async def handler(request: web.Request) -> web.Response:
+        received.append(await request.read())
+        return web.Response()
+
+    app = web.Application(client_max_size=1 << 30)
+    app.router.add_post("/", handler)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    port = site._server.sockets[0].getsockname()[1]
+    try:
+        async with aiohttp.ClientSession() as session:
+            payload = SampleFilePayload(path, os.path.getsize(path))
+            async with session.post(f"http://127.0.0.1:{port}/", data=payload) as resp:
+                resp.raise_for_status()
+    finally:
+        await runner.cleanup()
+    return received[0]
+
+
+class SampleFilePayloadTest(unittest.TestCase):
+    def setUp(self):
+        # Larger than one read chunk, so the streaming path loops
+        self.content = os.urandom(5 * 1024 * 1024 + 123)
+        fd, self.path = tempfile.mkstemp()
+        with os.fdopen(fd, "wb") as f:
+            f.write(self.content)
+
+    def tearDown(self):
+        os.unlink(self.path)
+
+    def test_upload_on_asyncio_loop(self):
+        self.assertEqual(asyncio.run(_upload(self.path)), self.content)
+
+    def test_upload_falls_back_when_sendfile_unsupported(self):
+        async def unsupported(*args, **kwargs):
+            raise NotImplementedError
+
+        loop = asyncio.new_event_loop()
+        loop.sendfile = unsupported
+        try:
+            self.assertEqual(loop.run_until_complete(_upload(self.path)), self.content)
+        finally:
+            loop.close()
+
+    @unittest.skipIf(uvloop is None, "uvloop is not installed")
+    def test_upload_on_uvloop(self):
+        loop = uvloop.new_event_loop()
+        try:
+            self.assertEqual(loop.run_until_complete(_upload(self.path)), self.content)
+        finally:
+            loop.close()
+
+
+if __name__ == "__main__":
+    unittest.main()
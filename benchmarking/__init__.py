@@ -4,4 +4,13 @@ ODC Sync Wrapper Benchmarking Framework
 A Python package for load testing and benchmarking the ODC Sync Wrapper API.
 """
 
+import logging
+
 __version__ = "1.0.0"
+
+# Configure logging once for the whole package, unless the application has
+# already set up its own handlers
+if not logging.getLogger().handlers:
+    logging.basicConfig(
+        level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s"
+    )
@@ -0,0 +1,37 @@
+"""Event loop selection for the benchmarking CLI commands."""
+
+import asyncio
+import sys
+from typing import Any, Coroutine, TypeVar
+
+# uvloop is optional; fall back to the stock asyncio loop when unavailable
+if sys.platform != "win32":
+    try:
+        import uvloop
+    except ImportError:
+        uvloop = None
+else:
+    uvloop = None
+
+T = TypeVar("T")
+
+
+def run(coro: Coroutine[Any, Any, T]) -> T:
+    """
+    Run a coroutine to completion, using uvloop when it is installed.
+
+    Args:
+        coro: Coroutine to run
+
+    Returns:
+        The coroutine's result
+    """
+    if uvloop is None:
+        return asyncio.run(coro)
+
+    # uvloop.run() only exists from uvloop 0.18
+    if sys.version_info >= (3, 11) and hasattr(uvloop, "run"):
+        return uvloop.run(coro)
+
+    uvloop.install()
+    return asyncio.run(coro)
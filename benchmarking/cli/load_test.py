@@ -1,12 +1,12 @@
 """CLI for single load tests."""
 
 import argparse
-import asyncio
 import sys
+from datetime import datetime
 from pathlib import Path
 
 from ..core.models import TestConfig
-from ..core.load_tester import LoadTester
+from .event_loop import run as run_async
 
 
 def main():
@@ -40,8 +40,48 @@ def main():
         type=int,
         help="Test duration in seconds (required for --rate-mode)",
     )
+    parser.add_argument(
+        "--max-in-flight",
+        type=int,
+        default=None,
+        help="Maximum requests in flight in --rate-mode; sending pauses at the "
+        "cap (default: the connection limit; 0 for no cap, keeping the target "
+        "rate however slow the server gets)",
+    )
+    parser.add_argument(
+        "--connection-limit",
+        type=int,
+        default=200,
+        help="Maximum open connections to the server in --rate-mode (default: 200)",
+    )
+    parser.add_argument(
+        "--warm-connections",
+        type=int,
+        default=0,
+        help="Connections to open with /health checks before --rate-mode starts "
+        "timing, capped at the connection limit (default: 0)",
+    )
 
     # Common arguments
+    parser.add_argument(
+        "--max-retries",
+        type=int,
+        default=0,
+        help="Retries for throttled (429/503) responses, with doubling backoff "
+        "(default: 0, count them as failures)",
+    )
+    parser.add_argument(
+        "--retry-min",
+        type=float,
+        default=0.5,
+        help="First retry delay in seconds (default: 0.5)",
+    )
+    parser.add_argument(
+        "--retry-max",
+        type=float,
+        default=8.0,
+        help="Maximum retry delay in seconds (default: 8.0)",
+    )
     parser.add_argument(
         "--server-url",
         type=str,
@@ -74,11 +114,27 @@ def main():
         if args.duration <= 0:
             print("Error: duration must be positive")
             sys.exit(1)
+        if args.max_in_flight is not None and args.max_in_flight < 0:
+            print("Error: max-in-flight must not be negative")
+            sys.exit(1)
+        if args.connection_limit <= 0:
+            print("Error: connection-limit must be positive")
+            sys.exit(1)
+        if args.warm_connections < 0:
+            print("Error: warm-connections must not be negative")
+            sys.exit(1)
     elif args.sequential_mode:
         if args.sequential_mode <= 0:
             print("Error: sequential count must be positive")
             sys.exit(1)
 
+    if args.max_retries < 0:
+        print("Error: max-retries must not be negative")
+        sys.exit(1)
+    if args.retry_min < 0 or args.retry_max < args.retry_min:
+        print("Error: retry delays must satisfy 0 <= retry-min <= retry-max")
+        sys.exit(1)
+
     # Check if samples directory exists
     samples_path = Path(args.samples_dir)
     if not samples_path.exists():
@@ -92,27 +148,39 @@ def main():
             samples_dir=args.samples_dir,
             files_per_second=args.files_per_second,
             duration=args.duration,
+            max_in_flight=args.max_in_flight,
+            connection_limit=args.connection_limit,
+            warm_connections=args.warm_connections,
+            max_retries=args.max_retries,
+            retry_min=args.retry_min,
+            retry_max=args.retry_max,
         )
     else:
         config = TestConfig(
             server_url=args.server_url,
             samples_dir=args.samples_dir,
             sequential_count=args.sequential_mode,
+            max_retries=args.max_retries,
+            retry_min=args.retry_min,
+            retry_max=args.retry_max,
         )
 
+    # Imported here so --help and argument errors don't pay for aiohttp
+    from ..core.load_tester import LoadTester
+
     # Create and run load tester
     tester = LoadTester(config, api_key=args.api_key)
 
     try:
-        result = asyncio.run(tester.run())
+        result = run_async(tester.run())
         tester.print_results(result)
     except KeyboardInterrupt:
         print("\nTest interrupted by user")
-        if tester.results:
+        if tester.has_results():
             result = tester._calculate_results(
                 test_mode="interrupted",
-                start_datetime=tester.start_time,
-                end_datetime=None,
+                start_datetime=tester.start_datetime,
+                end_datetime=datetime.now(),
             )
             tester.print_results(result)
     except Exception as e:
@@ -1,15 +1,15 @@
 """CLI for datasource sweep tests."""
 
 import argparse
-import asyncio
 import sys
+import traceback
 from typing import List
 
-from ..sweeps.datasource_sweep import DatasourceSweep
 from ..sweeps.presets import (
     SEQUENTIAL_SWEEP_DEFAULTS,
     RATE_LIMITED_SWEEP_DEFAULTS,
 )
+from .event_loop import run as run_async
 
 
 def parse_counts(counts_str: str) -> List[int]:
@@ -97,7 +97,8 @@ def main():
             "--startup-wait",
             type=int,
             default=20,
-            help="Seconds to wait for container startup (default: 20)",
+            help="Maximum seconds to wait for the container to pass its health "
+            "check (default: 20)",
         )
         subparser.add_argument(
             "--batch-interval-ms",
@@ -111,16 +112,34 @@ def main():
             default=1000,
             help="Maximum batch size (default: 1000)",
         )
+        subparser.add_argument(
+            "--max-parallel",
+            type=int,
+            default=1,
+            help="Number of containers to test at once, on consecutive host ports "
+            "from 8844 (default: 1). Parallel runs share this machine, so their "
+            "latencies affect each other",
+        )
 
     args = parser.parse_args()
 
+    if args.max_parallel <= 0:
+        print("Error: max-parallel must be positive")
+        sys.exit(1)
+
+    # Imported here so --help and argument errors don't pay for aiohttp,
+    # pandas and the rest of the load tester
+    from ..sweeps.datasource_sweep import DatasourceSweep
+
     # Create sweep orchestrator
-    sweep = DatasourceSweep(docker_image=args.docker_image)
+    sweep = DatasourceSweep(
+        docker_image=args.docker_image, max_parallel=args.max_parallel
+    )
 
     try:
         if args.mode == "sequential":
             counts = parse_counts(args.counts)
-            asyncio.run(
+            run_async(
                 sweep.run_sequential_sweep(
                     datasource_counts=counts,
                     files_per_test=args.files,
@@ -132,7 +151,7 @@ def main():
             )
         elif args.mode == "rate-limited":
             counts = parse_counts(args.counts)
-            asyncio.run(
+            run_async(
                 sweep.run_rate_limited_sweep(
                     datasource_counts=counts,
                     files_per_second=args.files_per_second,
@@ -153,8 +172,6 @@ def main():
             )
     except Exception as e:
         print(f"Error running sweep: {e}")
-        import traceback
-
         traceback.print_exc()
         sys.exit(1)
 
@@ -1,15 +1,13 @@
 """CLI for multi-rate test suite."""
 
 import argparse
-import asyncio
 import sys
+import traceback
 from pathlib import Path
-from typing import List
+from typing import List, Optional
 
 from ..core.models import TestConfig, TestResult
-from ..core.load_tester import LoadTester
-from ..results.aggregator import ResultAggregator
-from ..results.charts import generate_charts
+from .event_loop import run as run_async
 
 
 async def run_test_suite(
@@ -18,61 +16,105 @@ async def run_test_suite(
     duration: int,
     api_key: str = None,
     test_rates: List[int] = None,
+    requests_per_rate: Optional[int] = None,
+    warm_connections: int = 0,
 ) -> List[TestResult]:
-    """Run a series of load tests with incrementing rates."""
+    """
+    Run a series of load tests with incrementing rates.
+
+    Each rate runs for duration seconds. With requests_per_rate, a rate stops
+    as soon as it has sent about that many requests, so high rates finish
+    early while low rates still run for at most duration. Each rate first
+    opens up to warm_connections connections, which later rates find already
+    open in the shared session.
+    """
+    from ..core.load_tester import LoadTester, create_session
+    from ..core.sample_loader import SampleLoader
+    from ..results.aggregator import ResultAggregator
+
     if test_rates is None:
         test_rates = [1, 2, 4, 8, 16, 32]
 
     aggregator = ResultAggregator()
+    # Completed request latencies from every rate, for suite-wide percentiles
+    tier_latencies = []
+
+    # Every test sends the same samples, so they are read from disk once
+    sample_loader = SampleLoader(samples_dir)
+    await sample_loader.load()
 
     print(f"\nStarting Load Test Suite with {len(test_rates)} test configurations")
     print(f"Test rates: {test_rates}")
     print(f"Duration per test: {duration} seconds")
 
-    for i, rate in enumerate(test_rates):
-        print(f"\n{'='*60}")
-        print(f"Running test {i+1}/{len(test_rates)}: {rate} files/second")
-        print(f"{'='*60}")
+    # One session for every rate, so its connections stay open from one test
+    # to the next instead of each test opening them again
+    async with create_session(
+        TestConfig(server_url=server_url, samples_dir=samples_dir)
+    ) as session:
+        for i, rate in enumerate(test_rates):
+            print(f"\n{'='*60}")
+            print(f"Running test {i+1}/{len(test_rates)}: {rate} files/second")
+            print(f"{'='*60}")
 
-        config = TestConfig(
-            server_url=server_url,
-            samples_dir=samples_dir,
-            files_per_second=rate,
-            duration=duration,
-        )
+            rate_duration = duration
+            if requests_per_rate:
+                rate_duration = min(duration, max(1, -(-requests_per_rate // rate)))
+                print(f"Duration: {rate_duration} seconds")
 
-        tester = LoadTester(config, api_key=api_key)
-
-        try:
-            result = await tester.run()
-            aggregator.add_result(result)
-
-            # Print immediate results
-            print(f"\nTest Results for {rate} files/second:")
-            print(f"  Throughput: {result.throughput_rps:.2f} req/s")
-            print(f"  Avg Latency: {result.avg_latency_ms:.2f}ms")
-            print(f"  P95 Latency: {result.p95_latency_ms:.2f}ms")
-            print(f"  Error Rate: {result.error_rate:.2f}%")
-
-        except Exception as e:
-            print(f"Test failed for rate {rate}: {e}")
-            # Create a failed result
-            failed_result = TestResult(
-                datasource_count=None,
-                test_mode="rate_limited",
-                total_requests=0,
-                successful_requests=0,
-                failed_requests=0,
-                avg_latency_ms=0,
-                min_latency_ms=0,
-                max_latency_ms=0,
-                p95_latency_ms=0,
-                p99_latency_ms=0,
-                throughput_rps=0,
-                error_rate=100.0,
-                target_files_per_second=rate,
+            config = TestConfig(
+                server_url=server_url,
+                samples_dir=samples_dir,
+                files_per_second=rate,
+                duration=rate_duration,
+                warm_connections=warm_connections,
             )
-            aggregator.add_result(failed_result)
+
+            tester = LoadTester(
+                config, api_key=api_key, sample_loader=sample_loader, session=session
+            )
+
+            try:
+                result = await tester.run()
+                aggregator.add_result(result)
+                tier_latencies.append(tester.latencies_ms())
+
+                # Print immediate results
+                print(f"\nTest Results for {rate} files/second:")
+                print(f"  Throughput: {result.throughput_rps:.2f} req/s")
+                print(f"  Avg Latency: {result.avg_latency_ms:.2f}ms")
+                print(f"  P95 Latency: {result.p95_latency_ms:.2f}ms")
+                print(f"  Error Rate: {result.error_rate:.2f}%")
+
+            except Exception as e:
+                print(f"Test failed for rate {rate}: {e}")
+                # Create a failed result
+                failed_result = TestResult(
+                    datasource_count=None,
+                    test_mode="rate_limited",
+                    total_requests=0,
+                    successful_requests=0,
+                    failed_requests=0,
+                    avg_latency_ms=0,
+                    min_latency_ms=0,
+                    max_latency_ms=0,
+                    p95_latency_ms=0,
+                    p99_latency_ms=0,
+                    throughput_rps=0,
+                    error_rate=100.0,
+                    target_files_per_second=rate,
+                )
+                aggregator.add_result(failed_result)
+
+    if tier_latencies:
+        # Percentiles can't be combined from per-rate values, so they are
+        # taken over every request of the suite
+        import numpy as np
+
+        latencies = np.concatenate(tier_latencies)
+        p50, p95, p99 = np.percentile(latencies, (50, 95, 99)).tolist()
+        print(f"\nLatency across all rates ({len(latencies)} requests):")
+        print(f"  P50: {p50:.2f}ms  P95: {p95:.2f}ms  P99: {p99:.2f}ms")
 
     return aggregator.results
 
@@ -112,11 +154,30 @@ def main():
         default="1,2,4,8,16,32",
         help="Comma-separated list of rates to test (default: 1,2,4,8,16,32)",
     )
+    parser.add_argument(
+        "--requests-per-rate",
+        type=int,
+        default=None,
+        help="Shorten each test to about this many requests, never running "
+        "longer than --duration (default: every rate runs for --duration)",
+    )
+    parser.add_argument(
+        "--warm-connections",
+        type=int,
+        default=0,
+        help="Connections to open with /health checks before each rate starts "
+        "timing (default: 0)",
+    )
     parser.add_argument(
         "--no-charts",
         action="store_true",
         help="Skip chart generation",
     )
+    parser.add_argument(
+        "--no-show",
+        action="store_true",
+        help="Save the chart without opening a window (for headless runs)",
+    )
 
     args = parser.parse_args()
 
@@ -129,37 +190,61 @@ def main():
     # Parse rates
     test_rates = [int(r.strip()) for r in args.rates.split(",")]
 
+    if args.requests_per_rate is not None and args.requests_per_rate <= 0:
+        print("Error: requests-per-rate must be positive")
+        sys.exit(1)
+    if args.warm_connections < 0:
+        print("Error: warm-connections must not be negative")
+        sys.exit(1)
+
     # Print configuration
     print("Starting Load Test Suite...")
     print(f"Server URL: {args.server_url}")
     print(f"Samples Directory: {args.samples_dir}")
     print(f"Duration per test: {args.duration} seconds")
+    if args.requests_per_rate:
+        print(f"Requests per rate: {args.requests_per_rate} (shortens faster rates)")
     print(f"API Key: {'***provided***' if args.api_key else 'None'}")
     print(f"Test rates: {', '.join(map(str, test_rates))} files/second")
 
+    # Imported here so --help and argument errors don't pay for aiohttp and
+    # pandas; matplotlib is only loaded when charts are drawn
+    from ..results.aggregator import ResultAggregator
+
     aggregator = ResultAggregator()
 
     try:
-        results = asyncio.run(
+        results = run_async(
             run_test_suite(
                 server_url=args.server_url,
                 samples_dir=args.samples_dir,
                 duration=args.duration,
                 api_key=args.api_key,
                 test_rates=test_rates,
+                requests_per_rate=args.requests_per_rate,
+                warm_connections=args.warm_connections,
             )
         )
 
         aggregator.add_results(results)
 
         # Print summary and generate charts
+        description = f"Duration per test: {args.duration}s | Rates: {args.rates}"
+        if args.requests_per_rate:
+            description += f" | Requests per rate: {args.requests_per_rate}"
         aggregator.print_summary_table(
             title="LOAD TEST SUITE RESULTS",
-            description=f"Duration per test: {args.duration}s | Rates: {args.rates}",
+            description=description,
         )
 
         if not args.no_charts and results:
-            generate_charts(results, x_label="Target Rate (files/second)")
+            from ..results.charts import generate_charts
+
+            generate_charts(
+                results,
+                show=not args.no_show,
+                x_label="Target Rate (files/second)",
+            )
 
     except KeyboardInterrupt:
         print("\nTest suite interrupted by user")
@@ -169,8 +254,6 @@ def main():
             )
     except Exception as e:
         print(f"Error running test suite: {e}")
-        import traceback
-
         traceback.print_exc()
         sys.exit(1)
 
@@ -1,7 +1,16 @@
 """Core benchmarking components."""
 
 from .models import TestConfig, TestResult
-from .load_tester import LoadTester
 from .sample_loader import SampleLoader
 
 __all__ = ["TestConfig", "TestResult", "LoadTester", "SampleLoader"]
+
+
+def __getattr__(name):
+    # LoadTester pulls in aiohttp and numpy, so it is imported on first
+    # access; the models and sample loader stay cheap to import
+    if name == "LoadTester":
+        from .load_tester import LoadTester
+
+        return LoadTester
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -2,16 +2,99 @@
 
 import asyncio
 import aiohttp
-import json
 import logging
-import statistics
+import re
 import time
+from collections import Counter
+from contextlib import asynccontextmanager
 from datetime import datetime
-from typing import List, Dict, Any, Optional
+from typing import AsyncIterator, Callable, List, Dict, Optional, Tuple
 
-from .models import TestConfig, TestResult
+import numpy as np
+
+from .models import RequestResult, TestConfig, TestResult
 from .sample_loader import SampleLoader
 
+# Markers that flag a 200 response as a failed classification, matched in a
+# single case-insensitive pass over the raw body
+_ERROR_PATTERN = re.compile(
+    rb"API key is required"
+    rb"|Unauthorized"
+    rb"|Authentication failed"
+    rb"|Invalid API key"
+    rb"|Access denied"
+    rb'|"error"'
+    rb'|"message"'
+    rb'|"status"\s*:\s*"FAILED"',
+    re.IGNORECASE,
+)
+
+# Responses that mean the server is throttling and the request can be retried
+_RETRY_STATUSES = frozenset((429, 503))
+_THROTTLE_PATTERN = re.compile(rb"rate.?limit|quota", re.IGNORECASE)
+
+
+def _is_throttled(status: int, body: bytes) -> bool:
+    """Whether a response is a transient throttle rather than a real failure."""
+    if status in _RETRY_STATUSES:
+        return True
+    return status != 200 and _THROTTLE_PATTERN.search(body) is not None
+
+
+# Distinct errors listed in the error summary
+_MAX_ERRORS_SHOWN = 20
+
+# Headers aiohttp would add to every request. Without Accept-Encoding the
+# server sends bodies uncompressed, so sessions skip decompression and the
+# error patterns can scan the raw bytes as received.
+_SKIP_AUTO_HEADERS = ("User-Agent", "Accept-Encoding")
+
+
+def create_session(config: TestConfig) -> aiohttp.ClientSession:
+    """
+    Create a client session for rate-limited tests.
+
+    It holds up to config.connection_limit connections. Pass it to several
+    LoadTesters to keep its connections open from one test to the next;
+    the caller closes it.
+    """
+    connector = aiohttp.TCPConnector(
+        limit=config.connection_limit,
+        limit_per_host=config.connection_limit,
+        ttl_dns_cache=3600,
+    )
+    return aiohttp.ClientSession(
+        timeout=aiohttp.ClientTimeout(total=1200),  # 20 minute timeout
+        connector=connector,
+        skip_auto_headers=_SKIP_AUTO_HEADERS,
+        auto_decompress=False,
+    )
+
+
+def _create_sequential_session() -> aiohttp.ClientSession:
+    """Create a client session for sequential tests."""
+    # Only one request is ever in flight, so a single kept-alive connection
+    # (and one DNS lookup) serves the whole run
+    connector = aiohttp.TCPConnector(
+        limit=1, limit_per_host=1, ttl_dns_cache=3600, keepalive_timeout=600
+    )
+    return aiohttp.ClientSession(
+        timeout=aiohttp.ClientTimeout(total=1200),  # 20 minute timeout
+        connector=connector,
+        skip_auto_headers=_SKIP_AUTO_HEADERS,
+        auto_decompress=False,
+    )
+
+
+class _BufferWriter:
+    """Minimal stream writer that collects a payload's serialized bytes."""
+
+    def __init__(self):
+        self.chunks: List[bytes] = []
+
+    async def write(self, chunk: bytes) -> None:
+        self.chunks.append(bytes(chunk))
+
 
 class LoadTester:
     """
@@ -22,21 +105,59 @@ class LoadTester:
     - Rate-limited: Sends files at a specified rate for a specified duration
     """
 
-    def __init__(self, config: TestConfig, api_key: Optional[str] = None):
+    logger = logging.getLogger(__name__)
+
+    def __init__(
+        self,
+        config: TestConfig,
+        api_key: Optional[str] = None,
+        sample_loader: Optional[SampleLoader] = None,
+        session: Optional[aiohttp.ClientSession] = None,
+    ):
+        """
+        Args:
+            config: Test configuration
+            api_key: API key sent as a Bearer token, if any
+            sample_loader: Already-loaded samples to send, so a series of
+                tests reads them from disk only once. Defaults to a new loader
+                for config.samples_dir, loaded when the test runs.
+            session: Client session to send on, shared with other tests so
+                its connections stay open between them (see create_session).
+                The caller closes it. Defaults to a new session per run.
+        """
         self.config = config
         self.api_key = api_key
-        self.sample_loader = SampleLoader(config.samples_dir)
-        self.results: List[Dict[str, Any]] = []
+        self.sample_loader = sample_loader or SampleLoader(config.samples_dir)
+        self.session = session
+        # Per-request metrics, stored column-wise and indexed by request
+        # number; sized by _allocate_results() when a run starts. At 12 bytes
+        # per request these are kept in full rather than folded into a
+        # latency histogram, so the reported percentiles stay exact.
+        self.latency_ns = np.empty(0, dtype=np.int64)
+        self.status = np.zeros(0, dtype=np.int16)
+        self.success = np.zeros(0, dtype=bool)
+        self.completed = np.zeros(0, dtype=bool)
+        # Only failed requests are kept whole, for the error summary
+        self.failures: List[RequestResult] = []
+        # One shared copy of each distinct error text among the failures
+        self._error_texts: Dict[str, str] = {}
+        self.total_retries = 0
+        # Earliest request start and latest completion, for the throughput window
+        self.first_start_ns: Optional[int] = None
+        self.last_end_ns = 0
+        # Encoded multipart body and its request headers, per sample file name
+        self._upload_cache: Dict[str, Tuple[aiohttp.BytesPayload, Dict[str, str]]] = {}
+        # Request pieces that are the same for every upload
+        self._post_url = f"{config.server_url}/classify-file"
+        self._auth_headers = {"Authorization": f"Bearer {api_key}"} if api_key else {}
+        # Run start: perf_counter() for elapsed time, wall clock for reporting
         self.start_time: Optional[float] = None
-
-        logging.basicConfig(
-            level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s"
-        )
-        self.logger = logging.getLogger(__name__)
+        self.start_datetime: Optional[datetime] = None
 
     async def run(self) -> TestResult:
         """Run load test based on config (rate-limited or sequential)."""
-        await self.sample_loader.load()
+        if not len(self.sample_loader):
+            await self.sample_loader.load()
 
         if self.config.is_sequential:
             return await self.run_sequential()
@@ -48,89 +169,175 @@ class LoadTester:
                 "(files_per_second and duration)"
             )
 
+    @asynccontextmanager
+    async def _session(
+        self, new_session: Callable[[], aiohttp.ClientSession]
+    ) -> AsyncIterator[aiohttp.ClientSession]:
+        """
+        Yield the session to send requests on.
+
+        That is the shared session passed to the constructor if there is one,
+        otherwise a new session from new_session(), closed when the run ends.
+        """
+        if self.session is not None:
+            yield self.session
+        else:
+            async with new_session() as session:
+                yield session
+
+    def _allocate_results(self, total_requests: int) -> None:
+        """Size the per-request result arrays for a run of total_requests."""
+        self.latency_ns = np.empty(total_requests, dtype=np.int64)
+        self.status = np.zeros(total_requests, dtype=np.int16)
+        self.success = np.zeros(total_requests, dtype=bool)
+        self.completed = np.zeros(total_requests, dtype=bool)
+        self.failures = []
+        self._error_texts = {}
+        self.total_retries = 0
+        self.first_start_ns = None
+        self.last_end_ns = 0
+
+    def _store_result(self, idx: int, result: RequestResult) -> None:
+        """Record the result of request idx."""
+        self.latency_ns[idx] = result.latency_ns
+        self.status[idx] = result.status_code
+        self.success[idx] = result.success
+        self.completed[idx] = True
+        self.total_retries += result.retries
+        if self.first_start_ns is None or result.start_ns < self.first_start_ns:
+            self.first_start_ns = result.start_ns
+        end_ns = result.start_ns + result.latency_ns
+        if end_ns > self.last_end_ns:
+            self.last_end_ns = end_ns
+        if not result.success:
+            # A failing server tends to return the same body every time, so
+            # failures share one string per distinct error
+            error = result.error
+            if error is not None:
+                shared = self._error_texts.setdefault(error, error)
+                if shared is not error:
+                    result = result._replace(error=shared)
+            self.failures.append(result)
+
+    def has_results(self) -> bool:
+        """Whether any request has completed."""
+        return bool(self.completed.any())
+
+    def latencies_ms(self) -> np.ndarray:
+        """Latencies of the completed requests, in milliseconds."""
+        return self.latency_ns[self.completed] * 1e-6
+
+    async def _encode_upload(
+        self, file_name: str, file_content: bytes
+    ) -> Tuple[aiohttp.BytesPayload, Dict[str, str]]:
+        """
+        Return the multipart body and request headers for uploading a file.
+
+        Samples are resent many times over a run, so each one is encoded
+        once and the body reused for every later request. It is returned as
+        a ready-made payload, which aiohttp sends as-is instead of wrapping
+        the bytes in a new payload per request.
+        """
+        cached = self._upload_cache.get(file_name)
+        if cached is not None:
+            return cached
+
+        data = aiohttp.FormData()
+        data.add_field(
+            "file",
+            file_content,
+            filename=file_name,
+            content_type=self.sample_loader.get_content_type(file_name),
+        )
+        payload = data()
+        buffer = _BufferWriter()
+        await payload.write(buffer)
+
+        headers = {"Content-Type": payload.content_type, **self._auth_headers}
+        body = aiohttp.BytesPayload(
+            b"".join(buffer.chunks), content_type=payload.content_type
+        )
+        cached = (body, headers)
+        self._upload_cache[file_name] = cached
+        return cached
+
     async def send_file_request(
         self, session: aiohttp.ClientSession, file_name: str, file_content: bytes
-    ) -> Dict[str, Any]:
+    ) -> RequestResult:
         """Send a single file classification request."""
-        start_time = time.time()
+        # Timed on the monotonic clock, which wall-clock adjustments can't
+        # move backwards mid-request
+        start_ns = time.perf_counter_ns()
+        retries = 0
 
         try:
-            content_type = self.sample_loader.get_content_type(file_name)
-            data = aiohttp.FormData()
-            data.add_field(
-                "file", file_content, filename=file_name, content_type=content_type
-            )
+            upload, headers = await self._encode_upload(file_name, file_content)
+
+            # Throttled attempts are retried after a doubling delay; latency
+            # covers every attempt and wait, up to the final response
+            for attempt in range(self.config.max_retries + 1):
+                async with session.post(
+                    self._post_url, data=upload, headers=headers
+                ) as response:
+                    end_ns = time.perf_counter_ns()
+                    status = response.status
+                    # Kept as bytes: a successful response is only scanned, so
+                    # it never needs decoding in full
+                    body = await response.read()
+
+                if attempt == self.config.max_retries:
+                    break
+                if not _is_throttled(status, body):
+                    break
+                retries += 1
+                await asyncio.sleep(
+                    min(self.config.retry_max, self.config.retry_min * 2**attempt)
+                )
 
-            headers = {}
-            if self.api_key:
-                headers["Authorization"] = f"Bearer {self.api_key}"
-
-            async with session.post(
-                f"{self.config.server_url}/classify-file", data=data, headers=headers
-            ) as response:
-                end_time = time.time()
-                latency_ms = (end_time - start_time) * 1000
-                response_text = await response.text()
-
-                is_success = response.status == 200
-
-                # Additional validation for error patterns in successful HTTP responses
-                if is_success and response_text:
-                    try:
-                        json_response = json.loads(response_text)
-                        if (
-                            isinstance(json_response, dict)
-                            and json_response.get("status") == "FAILED"
-                        ):
-                            is_success = False
-                    except (json.JSONDecodeError, ValueError):
-                        pass
-
-                    if is_success:
-                        error_indicators = [
-                            "API key is required",
-                            "Unauthorized",
-                            "Authentication failed",
-                            "Invalid API key",
-                            "Access denied",
-                            '"error"',
-                            '"message"',
-                            '"status":"FAILED"',
-                            '"status": "FAILED"',
-                        ]
-                        response_lower = response_text.lower()
-                        for indicator in error_indicators:
-                            if indicator.lower() in response_lower:
-                                is_success = False
-                                break
-
-                result = {
-                    "status_code": response.status,
-                    "latency_ms": latency_ms,
-                    "success": is_success,
-                    "timestamp": start_time,
-                    "end_time": end_time,
-                    "file_name": file_name,
-                    "response_text": response_text[:200] if response_text else None,
-                }
-
-                if not is_success:
-                    result["error"] = response_text
-
-                return result
+            is_success = status == 200
+
+            # Additional validation for error patterns in successful HTTP
+            # responses. The pattern includes a "FAILED" status, so the body
+            # never needs parsing as JSON.
+            if is_success and _ERROR_PATTERN.search(body):
+                is_success = False
+
+            return RequestResult(
+                status_code=status,
+                latency_ns=end_ns - start_ns,
+                success=is_success,
+                start_ns=start_ns,
+                file_name=file_name,
+                error=None if is_success else body.decode("utf-8", "replace"),
+                retries=retries,
+            )
 
         except Exception as e:
-            end_time = time.time()
-            latency_ms = (end_time - start_time) * 1000
-            return {
-                "status_code": 0,
-                "latency_ms": latency_ms,
-                "success": False,
-                "timestamp": start_time,
-                "end_time": end_time,
-                "file_name": file_name,
-                "error": str(e),
-            }
+            return RequestResult(
+                status_code=0,
+                latency_ns=time.perf_counter_ns() - start_ns,
+                success=False,
+                start_ns=start_ns,
+                file_name=file_name,
+                error=str(e),
+                retries=retries,
+            )
+
+    async def _warm_up(self, session: aiohttp.ClientSession, count: int) -> None:
+        """Open up to count connections to the server with concurrent health checks."""
+        url = f"{self.config.server_url}/health"
+
+        async def check() -> None:
+            async with session.get(url) as response:
+                await response.read()
+
+        outcomes = await asyncio.gather(
+            *(check() for _ in range(count)), return_exceptions=True
+        )
+        failed = sum(isinstance(outcome, Exception) for outcome in outcomes)
+        if failed:
+            self.logger.warning(f"  {failed}/{count} warm-up health checks failed")
+        self.logger.info(f"  Warmed up {count - failed} connections")
 
     async def run_sequential(self) -> TestResult:
         """Run sequential test - send files one after another."""
@@ -142,29 +349,32 @@ class LoadTester:
         self.logger.info("Starting sequential test:")
         self.logger.info(f"  Sending {total_requests} files sequentially")
 
-        timeout = aiohttp.ClientTimeout(total=1200)  # 20 minute timeout
-        connector = aiohttp.TCPConnector(limit=10, limit_per_host=10)
+        self._allocate_results(total_requests)
+        start_datetime = self.start_datetime = datetime.now()
+        # Every success is logged in short runs, about a hundred of them in
+        # long ones; failures are always logged
+        progress_every = max(1, total_requests // 100)
 
-        start_datetime = datetime.now()
-        async with aiohttp.ClientSession(
-            timeout=timeout, connector=connector
-        ) as session:
-            self.start_time = time.time()
+        async with self._session(_create_sequential_session) as session:
+            self.start_time = time.perf_counter()
             file_index = 0
 
             for i in range(total_requests):
                 file_name, file_content = self.sample_loader.get_file(file_index)
                 file_index += 1
 
-                self.logger.info(f"Sending file {i + 1}/{total_requests}: {file_name}")
                 result = await self.send_file_request(session, file_name, file_content)
-                self.results.append(result)
+                self._store_result(i, result)
 
-                if result["success"]:
-                    self.logger.info(f"  Success - {result['latency_ms']:.0f}ms")
-                else:
+                if not result.success:
                     self.logger.warning(
-                        f"  Failed - {result.get('error', 'Unknown error')[:50]}..."
+                        f"File {i + 1}/{total_requests}: {file_name} failed - "
+                        f"{(result.error or 'Unknown error')[:50]}..."
+                    )
+                elif (i + 1) % progress_every == 0:
+                    self.logger.info(
+                        f"File {i + 1}/{total_requests}: {file_name} succeeded - "
+                        f"{result.latency_ms:.0f}ms"
                     )
 
         end_datetime = datetime.now()
@@ -191,38 +401,72 @@ class LoadTester:
         )
         self.logger.info(f"  Total requests: {total_requests}")
         self.logger.info(f"  Request interval: {request_interval:.3f}s")
-
-        timeout = aiohttp.ClientTimeout(total=1200)
-        connector = aiohttp.TCPConnector(limit=200, limit_per_host=200)
-
-        start_datetime = datetime.now()
-        async with aiohttp.ClientSession(
-            timeout=timeout, connector=connector
-        ) as session:
-            self.start_time = time.time()
+        max_in_flight = self.config.max_in_flight
+        if max_in_flight is None:
+            max_in_flight = self.config.connection_limit
+        if max_in_flight:
+            self.logger.info(f"  Max in flight: {max_in_flight}")
+
+        in_flight = asyncio.Semaphore(max_in_flight) if max_in_flight else None
+
+        self._allocate_results(total_requests)
+        start_datetime = self.start_datetime = datetime.now()
+        async with self._session(lambda: create_session(self.config)) as session:
+            if self.config.warm_connections:
+                await self._warm_up(
+                    session,
+                    min(self.config.warm_connections, self.config.connection_limit),
+                )
+            self.start_time = time.perf_counter()
+            loop = asyncio.get_running_loop()
+            send_start = loop.time()
             file_index = 0
-            tasks = []
+            # Only requests still in flight are referenced, so memory tracks
+            # concurrency rather than the length of the run
+            pending = set()
+            # Furthest any send fell behind its scheduled time, in seconds
+            max_lag = 0.0
 
             for i in range(total_requests):
+                # Pace against each request's scheduled send time rather than
+                # sleeping a fixed interval, so sleep overshoot and task
+                # creation time don't accumulate and lower the actual rate
+                deadline = send_start + i * request_interval
+                delay = deadline - loop.time()
+                if delay > 0:
+                    await asyncio.sleep(delay)
+
+                if in_flight is not None:
+                    await in_flight.acquire()
+                # Measured once the request can go out, so time spent waiting
+                # for an in-flight slot counts as lag
+                max_lag = max(max_lag, loop.time() - deadline)
+
                 file_name, file_content = self.sample_loader.get_file(file_index)
                 file_index += 1
 
                 task = asyncio.create_task(
-                    self._send_and_store(session, file_name, file_content)
+                    self._send_and_store(
+                        i, session, file_name, file_content, in_flight
+                    )
                 )
-                tasks.append(task)
-
-                if i < total_requests - 1:
-                    await asyncio.sleep(request_interval)
+                pending.add(task)
+                task.add_done_callback(pending.discard)
 
                 if (i + 1) % (self.config.files_per_second * 10) == 0:
-                    elapsed = time.time() - self.start_time
+                    elapsed = time.perf_counter() - self.start_time
                     self.logger.info(
                         f"Sent {i + 1}/{total_requests} requests ({elapsed:.1f}s elapsed)"
                     )
 
+            self.logger.info(
+                f"Sent {total_requests} requests in {loop.time() - send_start:.2f}s "
+                f"(scheduled {(total_requests - 1) * request_interval:.2f}s, "
+                f"max lag {max_lag * 1000:.1f}ms)"
+            )
             self.logger.info("Waiting for all requests to complete...")
-            await asyncio.gather(*tasks, return_exceptions=True)
+            while pending:
+                await asyncio.wait(pending)
 
         end_datetime = datetime.now()
         return self._calculate_results(
@@ -233,11 +477,20 @@ class LoadTester:
         )
 
     async def _send_and_store(
-        self, session: aiohttp.ClientSession, file_name: str, file_content: bytes
+        self,
+        idx: int,
+        session: aiohttp.ClientSession,
+        file_name: str,
+        file_content: bytes,
+        in_flight: Optional[asyncio.Semaphore] = None,
     ):
-        """Send a request and store the result."""
-        result = await self.send_file_request(session, file_name, file_content)
-        self.results.append(result)
+        """Send a request and store its result at idx, then release its in-flight slot."""
+        try:
+            result = await self.send_file_request(session, file_name, file_content)
+            self._store_result(idx, result)
+        finally:
+            if in_flight is not None:
+                in_flight.release()
 
     def _calculate_results(
         self,
@@ -247,34 +500,40 @@ class LoadTester:
         target_files_per_second: Optional[int] = None,
     ) -> TestResult:
         """Calculate test results from collected data."""
-        if not self.results:
+        if not self.has_results():
             raise ValueError("No results to calculate")
 
-        total_requests = len(self.results)
-        successful_requests = sum(1 for r in self.results if r["success"])
+        # An interrupted run leaves slots for unfinished requests unfilled
+        completed = self.completed
+        latencies = self.latencies_ms()
+
+        total_requests = len(latencies)
+        successful_requests = int(self.success[completed].sum())
         failed_requests = total_requests - successful_requests
 
-        latencies = [r["latency_ms"] for r in self.results]
-        avg_latency = statistics.mean(latencies)
-        min_latency = min(latencies)
-        max_latency = max(latencies)
+        avg_latency = float(latencies.mean())
+        min_latency = float(latencies.min())
+        max_latency = float(latencies.max())
 
-        sorted_latencies = sorted(latencies)
-        p95_index = int(0.95 * len(sorted_latencies))
-        p99_index = int(0.99 * len(sorted_latencies))
-        p95_latency = sorted_latencies[min(p95_index, len(sorted_latencies) - 1)]
-        p99_latency = sorted_latencies[min(p99_index, len(sorted_latencies) - 1)]
+        # Linearly interpolated between the two nearest samples; numpy selects
+        # just the ranks needed (linear time) rather than sorting everything
+        p95_latency, p99_latency = np.percentile(latencies, (95, 99)).tolist()
 
         # Calculate throughput from first request to last completion
-        first_request_start = min(r["timestamp"] for r in self.results)
-        last_request_completion = max(
-            r["timestamp"] + r["latency_ms"] / 1000 for r in self.results
-        )
-        actual_duration = last_request_completion - first_request_start
+        actual_duration = (self.last_end_ns - self.first_start_ns) / 1e9
         throughput = total_requests / actual_duration if actual_duration > 0 else 0
 
         error_rate = (failed_requests / total_requests) * 100
 
+        # One bincount over the status column; status 0 marks requests that
+        # raised before a response arrived
+        statuses = self.status[completed]
+        classes = np.bincount(statuses // 100, minlength=6).tolist()
+        status_counts = {f"{c}xx": classes[c] for c in range(1, 6)}
+        status_counts["429"] = int(np.count_nonzero(statuses == 429))
+        status_counts["no response"] = classes[0]
+        status_counts = {key: count for key, count in status_counts.items() if count}
+
         return TestResult(
             datasource_count=self.config.datasource_count,
             test_mode=test_mode,
@@ -292,7 +551,9 @@ class LoadTester:
             end_timestamp=end_datetime,
             duration_seconds=actual_duration,
             target_files_per_second=target_files_per_second,
-            raw_results=self.results,
+            total_retries=self.total_retries,
+            status_counts=status_counts,
+            failed_results=self.failures,
         )
 
     def print_results(self, result: TestResult):
@@ -304,6 +565,13 @@ class LoadTester:
         print(f"Successful Requests: {result.successful_requests}")
         print(f"Failed Requests:     {result.failed_requests}")
         print(f"Error Rate:          {result.error_rate:.2f}%")
+        if self.config.max_retries:
+            print(f"Throttle Retries:    {result.total_retries}")
+        if result.status_counts:
+            breakdown = ", ".join(
+                f"{key}: {count}" for key, count in result.status_counts.items()
+            )
+            print(f"Status Codes:        {breakdown}")
         print()
         print("LATENCY STATISTICS (ms)")
         print("-" * 30)
@@ -319,21 +587,32 @@ class LoadTester:
         print("=" * 60)
 
         # Print error details if any
-        if result.failed_requests > 0 and result.raw_results:
+        if result.failed_requests > 0 and result.failed_results:
             print("\nERROR SUMMARY")
             print("-" * 30)
-            error_counts: Dict[str, int] = {}
+            error_counts: Counter[str] = Counter()
             sample_errors: Dict[str, str] = {}
 
-            for r in result.raw_results:
-                if not r["success"]:
-                    error_text = r.get("error", f"HTTP {r['status_code']}")
-                    error_key = error_text[:100] if len(error_text) > 100 else error_text
-                    error_counts[error_key] = error_counts.get(error_key, 0) + 1
-                    if error_key not in sample_errors:
-                        sample_errors[error_key] = error_text
-
-            for error_key, count in error_counts.items():
+            # Failures share one string per distinct error, so they are
+            # tallied in a single Counter pass and only the distinct texts
+            # are truncated and grouped. The full text is kept only for keys
+            # that truncation shortened.
+            text_counts = Counter(
+                r.error or f"HTTP {r.status_code}" for r in result.failed_results
+            )
+            for error_text, count in text_counts.items():
+                error_key = error_text[:100]
+                error_counts[error_key] += count
+                if len(error_text) > 100:
+                    sample_errors.setdefault(error_key, error_text)
+
+            # Most frequent first, capped so a run that failed outright doesn't
+            # print every distinct error body
+            for error_key, count in error_counts.most_common(_MAX_ERRORS_SHOWN):
                 print(f"Error ({count} occurrences): {error_key}")
-                if error_key in sample_errors and len(sample_errors[error_key]) > 100:
-                    print(f"  Full error: {sample_errors[error_key]}")
+                full_error = sample_errors.get(error_key)
+                if full_error is not None:
+                    print(f"  Full error: {full_error}")
+            hidden = len(error_counts) - _MAX_ERRORS_SHOWN
+            if hidden > 0:
+                print(f"... and {hidden} more distinct errors")
@@ -1,11 +1,15 @@
 """Data models for benchmarking."""
 
-from dataclasses import dataclass, field
+import sys
+from dataclasses import dataclass, field, fields
 from datetime import datetime
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, NamedTuple
 
+# Slotted dataclasses drop the per-instance __dict__; slots= needs Python 3.10
+_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
 
-@dataclass
+
+@dataclass(**_SLOTS)
 class TestConfig:
     """Configuration for a single load test run."""
 
@@ -15,6 +19,23 @@ class TestConfig:
     # Rate-limited mode settings
     files_per_second: Optional[int] = None
     duration: Optional[int] = None
+    # Cap on requests in flight; sending pauses while it is reached, so no
+    # request waits for a connection with its timer running. None caps at
+    # connection_limit; 0 removes the cap, keeping the send rate fixed however
+    # slow the server gets
+    max_in_flight: Optional[int] = None
+    # Connections kept open to the server; requests beyond this wait for a
+    # free connection
+    connection_limit: int = 200
+    # Connections opened with GET /health before the timed run starts, so
+    # connection setup doesn't land in the first requests' latencies
+    warm_connections: int = 0
+
+    # Retries for throttled (429/503) responses, waiting retry_min seconds
+    # and doubling up to retry_max between attempts
+    max_retries: int = 0
+    retry_min: float = 0.5
+    retry_max: float = 8.0
 
     # Sequential mode settings
     sequential_count: Optional[int] = None
@@ -33,7 +54,24 @@ class TestConfig:
         return self.files_per_second is not None and self.duration is not None
 
 
-@dataclass
+class RequestResult(NamedTuple):
+    """Outcome of a single classification request."""
+
+    status_code: int  # 0 if the request raised before a response
+    latency_ns: int
+    success: bool
+    start_ns: int  # Request start on the time.perf_counter_ns() clock
+    file_name: str
+    error: Optional[str] = None
+    retries: int = 0  # Throttled attempts retried before this outcome
+
+    @property
+    def latency_ms(self) -> float:
+        """Latency in milliseconds."""
+        return self.latency_ns / 1e6
+
+
+@dataclass(**_SLOTS)
 class TestResult:
     """Results from a single load test run."""
 
@@ -65,24 +103,23 @@ class TestResult:
     # Optional: files per second target (for rate-limited mode)
     target_files_per_second: Optional[int] = None
 
-    # Optional: raw results for debugging
-    raw_results: Optional[List[Dict[str, Any]]] = field(default=None, repr=False)
+    # Throttled requests retried across the run
+    total_retries: int = 0
+
+    # Completed requests per response status class ("2xx", "4xx", ...), plus
+    # "429" for throttled responses and "no response" for requests that
+    # raised; classes with no requests are left out
+    status_counts: Optional[Dict[str, int]] = None
+
+    # Optional: results of the failed requests, for the error summary
+    failed_results: Optional[List[RequestResult]] = field(default=None, repr=False)
 
     def to_dict(self) -> Dict[str, Any]:
-        """Convert to dictionary for serialization."""
-        return {
-            "datasource_count": self.datasource_count,
-            "test_mode": self.test_mode,
-            "total_requests": self.total_requests,
-            "successful_requests": self.successful_requests,
-            "failed_requests": self.failed_requests,
-            "avg_latency_ms": self.avg_latency_ms,
-            "min_latency_ms": self.min_latency_ms,
-            "max_latency_ms": self.max_latency_ms,
-            "p95_latency_ms": self.p95_latency_ms,
-            "p99_latency_ms": self.p99_latency_ms,
-            "throughput_rps": self.throughput_rps,
-            "error_rate": self.error_rate,
-            "target_files_per_second": self.target_files_per_second,
-            "duration_seconds": self.duration_seconds,
-        }
+        """Convert to dictionary for serialization (without failed_results)."""
+        return {name: getattr(self, name) for name in _TEST_RESULT_DICT_FIELDS}
+
+
+# Every TestResult field except the per-request failures, in declaration order
+_TEST_RESULT_DICT_FIELDS = tuple(
+    f.name for f in fields(TestResult) if f.name != "failed_results"
+)
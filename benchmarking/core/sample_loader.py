@@ -1,33 +1,70 @@
 """Sample file loading utilities."""
 
-import aiofiles
+import asyncio
 import logging
+import mmap
+import os
 from pathlib import Path
-from typing import List, Tuple
+from typing import Dict, List, Tuple, Union
+
+# Files at least this large are memory-mapped rather than read, so their
+# contents live in the shared page cache instead of a private bytes copy
+_MMAP_MIN_BYTES = 1 << 20
+
+# Corpora of more than this many files, totalling less than the size below,
+# are read directly on the event loop: for many small files, handing reads to
+# worker threads costs more than the reads themselves. Loading happens before
+# any request is sent, so the brief block delays nothing.
+_BATCH_MIN_FILES = 16
+_BATCH_MAX_BYTES = 64 << 20
+
+# Sample content: bytes for small files, a read-only view of a mapping for
+# large ones. Both support len(), slicing and the buffer protocol.
+SampleContent = Union[bytes, memoryview]
 
 
 class SampleLoader:
     """Loads sample files for load testing."""
 
+    logger = logging.getLogger(__name__)
+
     def __init__(self, samples_dir: str):
         self.samples_dir = Path(samples_dir)
-        self.sample_files: List[Tuple[str, bytes]] = []
-        self.logger = logging.getLogger(__name__)
+        self.sample_files: List[Tuple[str, SampleContent]] = []
+        # Content type of each loaded sample, keyed by filename
+        self._content_types: Dict[str, str] = {}
 
-    async def load(self) -> List[Tuple[str, bytes]]:
+    async def load(self) -> List[Tuple[str, SampleContent]]:
         """
         Load all sample files into memory.
 
         Returns:
-            List of tuples (filename, content_bytes)
+            List of tuples (filename, content), where content is bytes, or a
+            memoryview over a read-only mapping for files of 1 MiB or more
 
         Raises:
             FileNotFoundError: If no sample files are found
         """
-        # Look for various sample file patterns
-        txt_files = list(self.samples_dir.glob("sample*.txt"))
-        pdf_files = list(self.samples_dir.glob("sample*.pdf"))
-        test_files = list(self.samples_dir.glob("testfile*"))
+        # Look for various sample file patterns (sample*.txt, sample*.pdf and
+        # testfile*) in a single pass over the directory
+        txt_files: List[os.DirEntry] = []
+        pdf_files: List[os.DirEntry] = []
+        test_files: List[os.DirEntry] = []
+        try:
+            with os.scandir(self.samples_dir) as entries:
+                for entry in entries:
+                    name = entry.name
+                    if name.startswith("testfile"):
+                        test_files.append(entry)
+                    elif name.startswith("sample"):
+                        if name.endswith(".txt"):
+                            txt_files.append(entry)
+                        elif name.endswith(".pdf"):
+                            pdf_files.append(entry)
+        except OSError:
+            # A missing, unreadable or non-directory path has no samples,
+            # reported below as for an empty directory
+            pass
 
         sample_files = txt_files + pdf_files + test_files
 
@@ -39,16 +76,31 @@ class SampleLoader:
             f"({len(txt_files)} .txt, {len(pdf_files)} .pdf, {len(test_files)} testfile*)"
         )
 
-        self.sample_files = []
-        for file_path in sample_files:
-            async with aiofiles.open(file_path, "rb") as f:
-                content = await f.read()
-                self.sample_files.append((file_path.name, content))
+        if len(sample_files) > _BATCH_MIN_FILES and (
+            sum(entry.stat().st_size for entry in sample_files) < _BATCH_MAX_BYTES
+        ):
+            # Many small files: read them all synchronously
+            self.sample_files = _read_samples(sample_files)
+        else:
+            # Few or large files: one worker-thread hop per file, with all
+            # files read concurrently
+            self.sample_files = list(
+                await asyncio.gather(
+                    *(
+                        asyncio.to_thread(_read_sample, entry.name, entry.path)
+                        for entry in sample_files
+                    )
+                )
+            )
+
+        self._content_types = {
+            name: _content_type_for(name) for name, _ in self.sample_files
+        }
 
         self.logger.info(f"Loaded {len(self.sample_files)} sample files")
         return self.sample_files
 
-    def get_file(self, index: int) -> Tuple[str, bytes]:
+    def get_file(self, index: int) -> Tuple[str, SampleContent]:
         """
         Get a sample file by index, cycling if necessary.
 
@@ -56,7 +108,7 @@ class SampleLoader:
             index: The index to get (will wrap around if larger than file count)
 
         Returns:
-            Tuple of (filename, content_bytes)
+            Tuple of (filename, content)
         """
         if not self.sample_files:
             raise RuntimeError("Sample files not loaded. Call load() first.")
@@ -67,6 +119,30 @@ class SampleLoader:
 
     def get_content_type(self, filename: str) -> str:
         """Determine content type based on file extension."""
-        if filename.lower().endswith(".pdf"):
-            return "application/pdf"
-        return "text/plain"
+        content_type = self._content_types.get(filename)
+        if content_type is None:
+            content_type = _content_type_for(filename)
+        return content_type
+
+
+def _read_sample(name: str, path: str) -> Tuple[str, SampleContent]:
+    """Read one sample file, returning (filename, content)."""
+    with open(path, "rb") as f:
+        if os.fstat(f.fileno()).st_size < _MMAP_MIN_BYTES:
+            return name, f.read()
+        # The mapping keeps its own handle on the file, so it stays valid
+        # after f is closed. Small files are read instead, as each mapping
+        # costs a file descriptor and at least a page.
+        return name, memoryview(mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ))
+
+
+def _read_samples(entries: List[os.DirEntry]) -> List[Tuple[str, SampleContent]]:
+    """Read sample files one after another, returning (filename, content) pairs."""
+    return [_read_sample(entry.name, entry.path) for entry in entries]
+
+
+def _content_type_for(filename: str) -> str:
+    """Content type for a sample file, based on its extension."""
+    if filename.lower().endswith(".pdf"):
+        return "application/pdf"
+    return "text/plain"
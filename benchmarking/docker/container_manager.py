@@ -2,30 +2,68 @@
 
 import logging
 import os
+import shutil
 import subprocess
 import time
+import urllib.error
+import urllib.request
 from contextlib import contextmanager
-from typing import Dict, Generator, Optional
+from typing import Dict, Generator, List, Optional, Tuple
+
+# Resolved once rather than searched for on PATH by every call; if docker
+# isn't installed the bare name is kept, so calls fail as they always did
+_DOCKER = shutil.which("docker") or "docker"
+
+# How long an is_running() answer is reused before asking docker again
+_RUNNING_CACHE_SECONDS = 1.0
+
+# Delays between readiness probes while a container starts: short at first,
+# then backing off so a slow start isn't polled constantly
+_READY_POLL_DELAYS = (0.05, 0.1, 0.2, 0.5)
+
+
+def _run_docker(args: List[str]) -> subprocess.CompletedProcess:
+    """
+    Run a docker command, capturing stdout and stderr as undecoded bytes.
+
+    Nothing but the caller's pipes needs to reach docker, so the child
+    inherits descriptors as-is instead of having them closed at spawn.
+    """
+    return subprocess.run(
+        [_DOCKER, *args],
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        close_fds=False,
+    )
 
 
 class DockerContainerManager:
     """Manages Docker container lifecycle for load testing."""
 
+    logger = logging.getLogger(__name__)
+
     def __init__(
         self,
         image: str,
         container_name: str = "odc-sync",
         port: int = 8844,
+        container_port: Optional[int] = None,
     ):
+        """
+        Args:
+            image: Docker image to run
+            container_name: Name given to the container
+            port: Host port the server is published on
+            container_port: Port the server listens on inside the container
+                (defaults to port)
+        """
         self.image = image
         self.container_name = container_name
         self.port = port
+        self.container_port = container_port or port
         self._container_id: Optional[str] = None
-
-        logging.basicConfig(
-            level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s"
-        )
-        self.logger = logging.getLogger(__name__)
+        # (monotonic time checked, running) from the last is_running() call
+        self._running_cache: Optional[Tuple[float, bool]] = None
 
     def get_env_vars(
         self,
@@ -89,17 +127,17 @@ class DockerContainerManager:
 
         Args:
             env_vars: Environment variables to pass to the container
-            startup_wait_seconds: Seconds to wait for container startup
+            startup_wait_seconds: Maximum seconds to wait for the server to
+                answer its health check
         """
         self.logger.info(f"Starting container {self.container_name} from {self.image}")
 
         # Build docker run command
         cmd = [
-            "docker",
             "run",
             "-d",
             "-p",
-            f"{self.port}:{self.port}",
+            f"{self.port}:{self.container_port}",
             f"--name={self.container_name}",
         ]
 
@@ -110,57 +148,93 @@ class DockerContainerManager:
         cmd.append(self.image)
 
         # Run the command
-        result = subprocess.run(cmd, capture_output=True, text=True)
+        result = _run_docker(cmd)
 
         if result.returncode != 0:
             raise RuntimeError(
-                f"Failed to start container: {result.stderr}\nCommand: {' '.join(cmd)}"
+                f"Failed to start container: {result.stderr.decode(errors='replace')}"
+                f"\nCommand: docker {' '.join(cmd)}"
             )
 
-        self._container_id = result.stdout.strip()
+        self._container_id = result.stdout.strip().decode()
+        self._running_cache = None
         self.logger.info(f"Container started: {self._container_id[:12]}")
 
         # Wait for startup
-        self.logger.info(f"Waiting {startup_wait_seconds} seconds for startup...")
-        time.sleep(startup_wait_seconds)
+        self.logger.info(f"Waiting up to {startup_wait_seconds} seconds for startup...")
+        if self.wait_until_ready(startup_wait_seconds):
+            self.logger.info("Server is ready")
+        else:
+            self.logger.warning(
+                f"Server did not pass its health check within {startup_wait_seconds}s; "
+                "continuing anyway"
+            )
+
+    def wait_until_ready(self, timeout_seconds: float) -> bool:
+        """
+        Poll the server's /health endpoint until it answers 200.
+
+        Args:
+            timeout_seconds: Maximum time to wait
+
+        Returns:
+            True once the server is healthy, False if the timeout expired first
+        """
+        url = f"http://localhost:{self.port}/health"
+        deadline = time.monotonic() + timeout_seconds
+        attempt = 0
+
+        while True:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return False
+            try:
+                with urllib.request.urlopen(url, timeout=min(remaining, 2.0)) as resp:
+                    if resp.status == 200:
+                        return True
+            except (urllib.error.URLError, OSError):
+                # Refused or reset while the server is still starting
+                pass
+
+            delay = _READY_POLL_DELAYS[min(attempt, len(_READY_POLL_DELAYS) - 1)]
+            attempt += 1
+            time.sleep(min(delay, max(deadline - time.monotonic(), 0)))
 
     def stop(self) -> None:
         """Stop and remove the container."""
         self.logger.info(f"Stopping container {self.container_name}")
 
-        # Stop the container
-        stop_result = subprocess.run(
-            ["docker", "stop", self.container_name], capture_output=True, text=True
-        )
-
-        if stop_result.returncode != 0:
-            self.logger.warning(f"Failed to stop container: {stop_result.stderr}")
-
-        # Remove the container
-        rm_result = subprocess.run(
-            ["docker", "rm", self.container_name], capture_output=True, text=True
-        )
+        # Kill and remove the container in one docker call; the server holds
+        # no state worth a graceful shutdown between sweep runs
+        rm_result = _run_docker(["rm", "-f", self.container_name])
 
         if rm_result.returncode != 0:
-            self.logger.warning(f"Failed to remove container: {rm_result.stderr}")
+            self.logger.warning(
+                "Failed to remove container: "
+                f"{rm_result.stderr.decode(errors='replace')}"
+            )
 
         self._container_id = None
+        self._running_cache = None
         self.logger.info("Container stopped and removed")
 
     def is_running(self) -> bool:
-        """Check if the container is currently running."""
-        result = subprocess.run(
-            [
-                "docker",
-                "ps",
-                "-q",
-                "-f",
-                f"name={self.container_name}",
-            ],
-            capture_output=True,
-            text=True,
-        )
-        return bool(result.stdout.strip())
+        """
+        Check if the container is currently running.
+
+        The answer is reused for up to a second, so polling loops don't spawn
+        a docker process on every check.
+        """
+        now = time.monotonic()
+        if self._running_cache is not None:
+            checked_at, running = self._running_cache
+            if now - checked_at < _RUNNING_CACHE_SECONDS:
+                return running
+
+        result = _run_docker(["ps", "-q", "-f", f"name={self.container_name}"])
+        running = bool(result.stdout.strip())
+        self._running_cache = (now, running)
+        return running
 
     @contextmanager
     def container(
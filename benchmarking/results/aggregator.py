@@ -1,62 +1,127 @@
 """Result aggregation and reporting."""
 
+import sys
+from dataclasses import replace
+
 import pandas as pd
 from typing import List, Optional
 
 from ..core.models import TestResult
 
+# Precision used for the metric columns in tables and exports
+FLOAT_FORMAT = "%.2f"
+
+# Columns holding float metrics, formatted with FLOAT_FORMAT on output
+_FLOAT_COLUMNS = ("Error%", "Avg_ms", "Min_ms", "Max_ms", "P95_ms", "P99_ms", "RPS")
+
 
 class ResultAggregator:
     """Aggregates and formats test results for export."""
 
-    def __init__(self):
+    def __init__(self, retain_failed_results: bool = False):
+        """
+        Args:
+            retain_failed_results: Keep each result's per-request failures.
+                By default the aggregator stores a copy of each result without
+                them, as the summary only needs the aggregate metrics; the
+                caller's own result objects are left unchanged.
+        """
+        self.retain_failed_results = retain_failed_results
         self.results: List[TestResult] = []
+        # DataFrames built from self.results (numeric, and with the metrics
+        # formatted for output); reset whenever results change
+        self._df_cache: Optional[pd.DataFrame] = None
+        self._formatted_df_cache: Optional[pd.DataFrame] = None
 
     def add_result(self, result: TestResult) -> None:
         """Add a single test result."""
-        self.results.append(result)
+        self.add_results([result])
 
     def add_results(self, results: List[TestResult]) -> None:
         """Add multiple test results."""
+        if not self.retain_failed_results:
+            # Copies without the failures, leaving the caller's results intact
+            results = [
+                replace(result, failed_results=None)
+                if result.failed_results is not None
+                else result
+                for result in results
+            ]
         self.results.extend(results)
+        self._invalidate_cache()
 
     def clear(self) -> None:
         """Clear all results."""
         self.results = []
+        self._invalidate_cache()
+
+    def _invalidate_cache(self) -> None:
+        """Drop the cached DataFrames after results change."""
+        self._df_cache = None
+        self._formatted_df_cache = None
 
     def to_dataframe(self) -> pd.DataFrame:
-        """Convert results to pandas DataFrame."""
-        data = []
-        for result in self.results:
-            data.append({
-                "DS_Count": result.datasource_count,
-                "Mode": result.test_mode,
-                "Total": result.total_requests,
-                "Success": result.successful_requests,
-                "Failed": result.failed_requests,
-                "Error%": f"{result.error_rate:.2f}",
-                "Avg_ms": f"{result.avg_latency_ms:.2f}",
-                "Min_ms": f"{result.min_latency_ms:.2f}",
-                "Max_ms": f"{result.max_latency_ms:.2f}",
-                "P95_ms": f"{result.p95_latency_ms:.2f}",
-                "P99_ms": f"{result.p99_latency_ms:.2f}",
-                "RPS": f"{result.throughput_rps:.2f}",
-            })
-        return pd.DataFrame(data)
+        """
+        Convert results to pandas DataFrame.
+
+        The frame is cached until results are added or cleared, so callers
+        must not modify it in place.
+        """
+        if self._df_cache is None:
+            self._df_cache = self._build_dataframe()
+        return self._df_cache
+
+    def _build_dataframe(self) -> pd.DataFrame:
+        """
+        Build the results DataFrame.
+
+        Metric columns are kept numeric (float64 for rates and latencies), so
+        callers can compute with them; FLOAT_FORMAT is applied only when the
+        frame is printed or exported (see _formatted_dataframe).
+        """
+        results = self.results
+        # Built column by column, so pandas infers each dtype once instead of
+        # reconciling a dict per row
+        return pd.DataFrame(
+            {
+                "DS_Count": [r.datasource_count for r in results],
+                "Mode": [r.test_mode for r in results],
+                "Total": [r.total_requests for r in results],
+                "Success": [r.successful_requests for r in results],
+                "Failed": [r.failed_requests for r in results],
+                "Error%": [float(r.error_rate) for r in results],
+                "Avg_ms": [float(r.avg_latency_ms) for r in results],
+                "Min_ms": [float(r.min_latency_ms) for r in results],
+                "Max_ms": [float(r.max_latency_ms) for r in results],
+                "P95_ms": [float(r.p95_latency_ms) for r in results],
+                "P99_ms": [float(r.p99_latency_ms) for r in results],
+                "RPS": [float(r.throughput_rps) for r in results],
+            }
+        )
+
+    def _formatted_dataframe(self) -> pd.DataFrame:
+        """Copy of the results DataFrame with the metric columns as text, cached
+        like to_dataframe()."""
+        if self._formatted_df_cache is None:
+            df = self.to_dataframe()
+            self._formatted_df_cache = df.assign(
+                **{col: df[col].map(FLOAT_FORMAT.__mod__) for col in _FLOAT_COLUMNS}
+            )
+        return self._formatted_df_cache
 
     def to_csv(self, path: str) -> None:
         """Export to CSV file."""
-        df = self.to_dataframe()
+        df = self._formatted_dataframe()
         df.to_csv(path, index=False)
 
     def to_tsv(self, path: str) -> None:
         """Export to TSV file."""
-        df = self.to_dataframe()
+        df = self._formatted_dataframe()
         df.to_csv(path, sep="\t", index=False)
 
     def get_tsv_string(self) -> str:
         """Get results as TSV string for easy copy/paste to spreadsheet."""
-        df = self.to_dataframe()
+        df = self._formatted_dataframe()
         return df.to_csv(sep="\t", index=False)
 
     def print_summary_table(
@@ -69,28 +134,30 @@ class ResultAggregator:
             print("No results to display.")
             return
 
-        print()
-        print("=" * 100)
-        if title:
-            print(title.center(100))
-        else:
-            print("BENCHMARK RESULTS SUMMARY".center(100))
-        print("=" * 100)
-
+        rule = "=" * 100
+        lines = [
+            "",
+            rule,
+            (title or "BENCHMARK RESULTS SUMMARY").center(100),
+            rule,
+        ]
         if description:
-            print(description)
-            print("-" * 100)
-
-        # Print the formatted table
-        df = self.to_dataframe()
-        print(df.to_string(index=False))
-
-        print()
-        print("=" * 100)
-        print("TSV OUTPUT (copy to spreadsheet):")
-        print("=" * 100)
-        print(self.get_tsv_string())
-        print("=" * 100)
+            lines += [description, "-" * 100]
+
+        # The formatted table, then the same rows as TSV
+        lines += [
+            self._formatted_dataframe().to_string(index=False),
+            "",
+            rule,
+            "TSV OUTPUT (copy to spreadsheet):",
+            rule,
+            self.get_tsv_string(),
+            rule,
+        ]
+
+        # Written in one go, so output from other tasks can't land mid-table
+        sys.stdout.write("\n".join(lines) + "\n")
+        sys.stdout.flush()
 
     def print_single_result(self, result: TestResult) -> None:
         """Print a single test result during sweep."""
@@ -99,3 +166,4 @@ class ResultAggregator:
         print(f"  Avg Latency: {result.avg_latency_ms:.2f}ms")
         print(f"  P95 Latency: {result.p95_latency_ms:.2f}ms")
         print(f"  Error Rate: {result.error_rate:.2f}%")
+
@@ -1,17 +1,45 @@
 """Chart generation for benchmark results."""
 
-import matplotlib.pyplot as plt
 from datetime import datetime
 from typing import List, Optional
 
+import numpy as np
+
 from ..core.models import TestResult
 
+# Imported on first use, so the backend can be chosen by the first call
+_pyplot = None
+
+
+def _get_pyplot(show: bool):
+    """
+    Import matplotlib.pyplot on first use.
+
+    Args:
+        show: Whether charts will be displayed; if not, the Agg backend is
+            selected so no GUI toolkit is loaded
+
+    Returns:
+        The matplotlib.pyplot module
+    """
+    global _pyplot
+    if _pyplot is None:
+        import matplotlib
+
+        if not show:
+            matplotlib.use("Agg")
+        import matplotlib.pyplot as plt
+
+        _pyplot = plt
+    return _pyplot
+
 
 def generate_charts(
     results: List[TestResult],
     output_path: Optional[str] = None,
     show: bool = True,
     x_label: str = "Datasource Count",
+    dpi: int = 150,
 ) -> Optional[str]:
     """
     Generate performance charts from test results.
@@ -21,6 +49,7 @@ def generate_charts(
         output_path: Path to save the chart (auto-generated if None)
         show: Whether to display the chart
         x_label: Label for x-axis
+        dpi: Resolution of the saved chart; 300 suits print
 
     Returns:
         Path to saved chart file, or None if not saved
@@ -29,83 +58,117 @@ def generate_charts(
         print("No results to chart.")
         return None
 
-    # Extract data for plotting
-    x_values = [r.datasource_count or 0 for r in results]
-    throughput = [r.throughput_rps for r in results]
-    avg_latency = [r.avg_latency_ms for r in results]
-    p95_latency = [r.p95_latency_ms for r in results]
-    error_rates = [r.error_rate for r in results]
+    # Extract data for plotting in one pass, as a float column per metric
+    (
+        x_values,
+        throughput,
+        avg_latency,
+        p95_latency,
+        error_rates,
+        min_latency,
+        max_latency,
+        target_rates,
+    ) = np.array(
+        [
+            (
+                r.datasource_count or 0,
+                r.throughput_rps,
+                r.avg_latency_ms,
+                r.p95_latency_ms,
+                r.error_rate,
+                r.min_latency_ms,
+                r.max_latency_ms,
+                r.target_files_per_second or 0,
+            )
+            for r in results
+        ],
+        dtype=float,
+    ).T
+
+    plt = _get_pyplot(show)
 
     # Create subplots
     fig, ((ax1, ax2), (ax3, ax4)) = plt.subplots(2, 2, figsize=(15, 12))
-    fig.suptitle("Benchmark Results", fontsize=16, fontweight="bold")
-
-    # Throughput chart
-    ax1.plot(x_values, throughput, "b-o", linewidth=2, markersize=6)
-    ax1.set_xlabel(x_label)
-    ax1.set_ylabel("Throughput (requests/second)")
-    ax1.set_title("Throughput vs " + x_label)
-    ax1.grid(True, alpha=0.3)
-
-    # Latency chart
-    ax2.plot(x_values, avg_latency, "g-o", label="Average", linewidth=2, markersize=6)
-    ax2.plot(
-        x_values, p95_latency, "r-o", label="95th Percentile", linewidth=2, markersize=6
-    )
-    ax2.set_xlabel(x_label)
-    ax2.set_ylabel("Latency (ms)")
-    ax2.set_title("Latency vs " + x_label)
-    ax2.legend()
-    ax2.grid(True, alpha=0.3)
-
-    # Error rate chart
-    ax3.plot(x_values, error_rates, "r-o", linewidth=2, markersize=6)
-    ax3.set_xlabel(x_label)
-    ax3.set_ylabel("Error Rate (%)")
-    ax3.set_title("Error Rate vs " + x_label)
-    ax3.grid(True, alpha=0.3)
-
-    # Efficiency chart (for rate-limited tests with target rate)
-    if results[0].target_files_per_second:
-        efficiency = [
-            (r.throughput_rps / r.target_files_per_second * 100)
-            if r.target_files_per_second
-            else 0
-            for r in results
-        ]
-        ax4.plot(x_values, efficiency, "purple", marker="o", linewidth=2, markersize=6)
-        ax4.set_xlabel(x_label)
-        ax4.set_ylabel("Efficiency (%)")
-        ax4.set_title("System Efficiency (Actual/Target Rate)")
-    else:
-        # For sequential tests, show min/max latency range
-        min_latency = [r.min_latency_ms for r in results]
-        max_latency = [r.max_latency_ms for r in results]
-        ax4.fill_between(
-            x_values, min_latency, max_latency, alpha=0.3, label="Min-Max Range"
+    try:
+        fig.suptitle("Benchmark Results", fontsize=16, fontweight="bold")
+
+        # Throughput chart
+        ax1.plot(x_values, throughput, "b-o", linewidth=2, markersize=6)
+        ax1.set_xlabel(x_label)
+        ax1.set_ylabel("Throughput (requests/second)")
+        ax1.set_title("Throughput vs " + x_label)
+        ax1.grid(True, alpha=0.3)
+
+        # Latency chart
+        ax2.plot(
+            x_values, avg_latency, "g-o", label="Average", linewidth=2, markersize=6
         )
-        ax4.plot(x_values, avg_latency, "g-o", label="Average", linewidth=2)
-        ax4.set_xlabel(x_label)
-        ax4.set_ylabel("Latency (ms)")
-        ax4.set_title("Latency Range")
-        ax4.legend()
-
-    ax4.grid(True, alpha=0.3)
-
-    plt.tight_layout()
-
-    # Save chart
-    saved_path = None
-    if output_path:
-        saved_path = output_path
-    else:
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        saved_path = f"benchmark_results_{timestamp}.png"
-
-    plt.savefig(saved_path, dpi=300, bbox_inches="tight")
-    print(f"\nChart saved as: {saved_path}")
-
-    if show:
-        plt.show()
-
-    return saved_path
+        ax2.plot(
+            x_values,
+            p95_latency,
+            "r-o",
+            label="95th Percentile",
+            linewidth=2,
+            markersize=6,
+        )
+        ax2.set_xlabel(x_label)
+        ax2.set_ylabel("Latency (ms)")
+        ax2.set_title("Latency vs " + x_label)
+        ax2.legend()
+        ax2.grid(True, alpha=0.3)
+
+        # Error rate chart
+        ax3.plot(x_values, error_rates, "r-o", linewidth=2, markersize=6)
+        ax3.set_xlabel(x_label)
+        ax3.set_ylabel("Error Rate (%)")
+        ax3.set_title("Error Rate vs " + x_label)
+        ax3.grid(True, alpha=0.3)
+
+        # Efficiency chart (for rate-limited tests with target rate)
+        if results[0].target_files_per_second:
+            # 0 where a run had no target rate
+            efficiency = np.divide(
+                throughput * 100,
+                target_rates,
+                out=np.zeros_like(throughput),
+                where=target_rates > 0,
+            )
+            ax4.plot(
+                x_values, efficiency, "purple", marker="o", linewidth=2, markersize=6
+            )
+            ax4.set_xlabel(x_label)
+            ax4.set_ylabel("Efficiency (%)")
+            ax4.set_title("System Efficiency (Actual/Target Rate)")
+        else:
+            # For sequential tests, show min/max latency range
+            ax4.fill_between(
+                x_values, min_latency, max_latency, alpha=0.3, label="Min-Max Range"
+            )
+            ax4.plot(x_values, avg_latency, "g-o", label="Average", linewidth=2)
+            ax4.set_xlabel(x_label)
+            ax4.set_ylabel("Latency (ms)")
+            ax4.set_title("Latency Range")
+            ax4.legend()
+
+        ax4.grid(True, alpha=0.3)
+
+        fig.tight_layout()
+
+        # Save chart
+        saved_path = None
+        if output_path:
+            saved_path = output_path
+        else:
+            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+            saved_path = f"benchmark_results_{timestamp}.png"
+
+        fig.savefig(saved_path, dpi=dpi, bbox_inches="tight")
+        print(f"\nChart saved as: {saved_path}")
+
+        if show:
+            plt.show()
+
+        return saved_path
+    finally:
+        # Release the figure so repeated calls don't accumulate them in pyplot
+        plt.close(fig)
@@ -1,6 +1,5 @@
 """Datasource sweep orchestration."""
 
-from .datasource_sweep import DatasourceSweep
 from .presets import (
     DEFAULT_PRELOAD_ANNOTATION_IDS,
     DOCKER_DEFAULTS,
@@ -15,3 +14,13 @@ __all__ = [
     "SEQUENTIAL_SWEEP_DEFAULTS",
     "RATE_LIMITED_SWEEP_DEFAULTS",
 ]
+
+
+def __getattr__(name):
+    # DatasourceSweep pulls in the load tester and its dependencies, so it is
+    # imported on first access; the presets stay cheap to import
+    if name == "DatasourceSweep":
+        from .datasource_sweep import DatasourceSweep
+
+        return DatasourceSweep
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
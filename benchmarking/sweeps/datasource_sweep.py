@@ -1,10 +1,12 @@
 """Datasource sweep orchestration - replaces shell scripts."""
 
+import asyncio
 import logging
-from typing import List, Optional
+from typing import Callable, Dict, List, Optional, Tuple
 
 from ..core.models import TestConfig, TestResult
 from ..core.load_tester import LoadTester
+from ..core.sample_loader import SampleLoader
 from ..docker.container_manager import DockerContainerManager
 from ..results.aggregator import ResultAggregator
 from .presets import (
@@ -25,11 +27,14 @@ class DatasourceSweep:
     - Aggregating results into a single summary table
     """
 
+    logger = logging.getLogger(__name__)
+
     def __init__(
         self,
         docker_image: str,
         dxr_base_url: Optional[str] = None,
         dxr_api_key: Optional[str] = None,
+        max_parallel: int = 1,
     ):
         """
         Initialize the sweep orchestrator.
@@ -38,22 +43,37 @@ class DatasourceSweep:
             docker_image: Docker image to use (required, no default)
             dxr_base_url: Base URL for DXR API (defaults to env var)
             dxr_api_key: API key for DXR (defaults to env var)
+            max_parallel: Number of containers to run at once, each on its own
+                host port counting up from the default port
         """
+        if max_parallel < 1:
+            raise ValueError("max_parallel must be at least 1")
+
         self.docker_image = docker_image
         self.dxr_base_url = dxr_base_url
         self.dxr_api_key = dxr_api_key
+        self.max_parallel = max_parallel
         self.docker_manager = DockerContainerManager(
             image=docker_image,
             container_name=DOCKER_DEFAULTS["container_name"],
             port=DOCKER_DEFAULTS["port"],
         )
+        # One manager per parallel worker, so each container gets its own name
+        # and host port
+        if max_parallel == 1:
+            self.docker_managers = [self.docker_manager]
+        else:
+            self.docker_managers = [
+                DockerContainerManager(
+                    image=docker_image,
+                    container_name=f"{DOCKER_DEFAULTS['container_name']}-{worker_id}",
+                    port=DOCKER_DEFAULTS["port"] + worker_id,
+                    container_port=DOCKER_DEFAULTS["port"],
+                )
+                for worker_id in range(max_parallel)
+            ]
         self.aggregator = ResultAggregator()
 
-        logging.basicConfig(
-            level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s"
-        )
-        self.logger = logging.getLogger(__name__)
-
     async def run_sequential_sweep(
         self,
         datasource_counts: Optional[List[int]] = None,
@@ -74,7 +94,7 @@ class DatasourceSweep:
             datasource_counts: List of datasource counts to test
             files_per_test: Number of files per test
             samples_dir: Directory containing sample files
-            startup_wait_seconds: Seconds to wait for container startup
+            startup_wait_seconds: Maximum seconds to wait for container startup
             batch_interval_ms: Batch interval in milliseconds
             max_batch_size: Maximum batch size
 
@@ -99,42 +119,21 @@ class DatasourceSweep:
         self.logger.info(f"  Max batch size: {batch_size}")
         self.logger.info("=" * 60)
 
-        self.aggregator.clear()
-        results = []
-
-        for count in counts:
-            self.logger.info("")
-            self.logger.info("=" * 50)
-            self.logger.info(f" Testing with DXR_ODC_DATASOURCE_COUNT={count}")
-            self.logger.info("=" * 50)
+        # Every run sends the same samples, so they are read from disk once
+        sample_loader = SampleLoader(samples)
+        await sample_loader.load()
 
-            env_vars = self.docker_manager.get_env_vars(
+        plan = self._build_plan(counts, batch_size, batch_interval)
+        results = await self._run_plan(
+            plan,
+            lambda count: TestConfig(
+                sequential_count=files,
+                samples_dir=samples,
                 datasource_count=count,
-                dxr_base_url=self.dxr_base_url,
-                dxr_api_key=self.dxr_api_key,
-                first_datasource_id=DOCKER_DEFAULTS["first_datasource_id"],
-                max_batch_size=batch_size,
-                batch_interval_ms=batch_interval,
-                job_status_poll_interval_ms=DOCKER_DEFAULTS[
-                    "job_status_poll_interval_ms"
-                ],
-                name_cache_expiry_ms=DOCKER_DEFAULTS["name_cache_expiry_ms"],
-                preload_annotation_ids=DEFAULT_PRELOAD_ANNOTATION_IDS,
-            )
-
-            with self.docker_manager.container(env_vars, wait_seconds):
-                config = TestConfig(
-                    sequential_count=files,
-                    samples_dir=samples,
-                    datasource_count=count,
-                )
-                tester = LoadTester(config)
-                result = await tester.run()
-                results.append(result)
-                self.aggregator.add_result(result)
-                self.aggregator.print_single_result(result)
-
-            self.logger.info(f"Completed run with count={count}")
+            ),
+            sample_loader,
+            wait_seconds,
+        )
 
         # Print final summary
         self.aggregator.print_summary_table(
@@ -166,7 +165,7 @@ class DatasourceSweep:
             files_per_second: Target files per second
             duration_seconds: Test duration in seconds
             samples_dir: Directory containing sample files
-            startup_wait_seconds: Seconds to wait for container startup
+            startup_wait_seconds: Maximum seconds to wait for container startup
             batch_interval_ms: Batch interval in milliseconds
             max_batch_size: Maximum batch size
 
@@ -193,43 +192,22 @@ class DatasourceSweep:
         self.logger.info(f"  Max batch size: {batch_size}")
         self.logger.info("=" * 60)
 
-        self.aggregator.clear()
-        results = []
-
-        for count in counts:
-            self.logger.info("")
-            self.logger.info("=" * 50)
-            self.logger.info(f" Testing with DXR_ODC_DATASOURCE_COUNT={count}")
-            self.logger.info("=" * 50)
-
-            env_vars = self.docker_manager.get_env_vars(
+        # Every run sends the same samples, so they are read from disk once
+        sample_loader = SampleLoader(samples)
+        await sample_loader.load()
+
+        plan = self._build_plan(counts, batch_size, batch_interval)
+        results = await self._run_plan(
+            plan,
+            lambda count: TestConfig(
+                files_per_second=fps,
+                duration=duration,
+                samples_dir=samples,
                 datasource_count=count,
-                dxr_base_url=self.dxr_base_url,
-                dxr_api_key=self.dxr_api_key,
-                first_datasource_id=DOCKER_DEFAULTS["first_datasource_id"],
-                max_batch_size=batch_size,
-                batch_interval_ms=batch_interval,
-                job_status_poll_interval_ms=DOCKER_DEFAULTS[
-                    "job_status_poll_interval_ms"
-                ],
-                name_cache_expiry_ms=DOCKER_DEFAULTS["name_cache_expiry_ms"],
-                preload_annotation_ids=DEFAULT_PRELOAD_ANNOTATION_IDS,
-            )
-
-            with self.docker_manager.container(env_vars, wait_seconds):
-                config = TestConfig(
-                    files_per_second=fps,
-                    duration=duration,
-                    samples_dir=samples,
-                    datasource_count=count,
-                )
-                tester = LoadTester(config)
-                result = await tester.run()
-                results.append(result)
-                self.aggregator.add_result(result)
-                self.aggregator.print_single_result(result)
-
-            self.logger.info(f"Completed run with count={count}")
+            ),
+            sample_loader,
+            wait_seconds,
+        )
 
         # Print final summary
         self.aggregator.print_summary_table(
@@ -242,6 +220,125 @@ class DatasourceSweep:
 
         return results
 
+    def _build_plan(
+        self, counts: List[int], batch_size: int, batch_interval: int
+    ) -> List[Tuple[Dict[str, str], int]]:
+        """
+        Build the (env_vars, datasource_count) pair for every run of a sweep.
+
+        Args:
+            counts: Datasource counts to test, in order
+            batch_size: Maximum batch size
+            batch_interval: Batch interval in milliseconds
+
+        Returns:
+            One (env_vars, count) tuple per count
+        """
+        # Only the datasource count differs between runs, so the rest of the
+        # environment is built once and copied per count
+        base_env = self.docker_manager.get_env_vars(
+            datasource_count=0,
+            dxr_base_url=self.dxr_base_url,
+            dxr_api_key=self.dxr_api_key,
+            first_datasource_id=DOCKER_DEFAULTS["first_datasource_id"],
+            max_batch_size=batch_size,
+            batch_interval_ms=batch_interval,
+            job_status_poll_interval_ms=DOCKER_DEFAULTS["job_status_poll_interval_ms"],
+            name_cache_expiry_ms=DOCKER_DEFAULTS["name_cache_expiry_ms"],
+            preload_annotation_ids=DEFAULT_PRELOAD_ANNOTATION_IDS,
+        )
+        return [
+            ({**base_env, "DXR_ODC_DATASOURCE_COUNT": str(count)}, count)
+            for count in counts
+        ]
+
+    async def _run_plan(
+        self,
+        plan: List[Tuple[Dict[str, str], int]],
+        make_config: Callable[[int], TestConfig],
+        sample_loader: SampleLoader,
+        wait_seconds: int,
+    ) -> List[TestResult]:
+        """
+        Run one load test per planned datasource count, each in its container.
+
+        The server reads its configuration only at startup, so every run gets
+        a freshly started container. Up to max_parallel containers run at once.
+
+        Args:
+            plan: (env_vars, count) pairs from _build_plan
+            make_config: Builds the test configuration for a datasource count
+            sample_loader: Loaded samples shared by every run
+            wait_seconds: Maximum seconds to wait for container startup
+
+        Returns:
+            List of test results, in plan order
+        """
+        self.aggregator.clear()
+
+        # Each run takes a free manager (and so a container name and port)
+        # for as long as it runs
+        free_managers: asyncio.Queue = asyncio.Queue()
+        for manager in self.docker_managers:
+            free_managers.put_nowait(manager)
+
+        async def run_one(env_vars: Dict[str, str], count: int) -> TestResult:
+            manager = await free_managers.get()
+            try:
+                return await self._run_in_container(
+                    manager, env_vars, count, make_config, sample_loader, wait_seconds
+                )
+            finally:
+                free_managers.put_nowait(manager)
+
+        results = list(
+            await asyncio.gather(
+                *(run_one(env_vars, count) for env_vars, count in plan)
+            )
+        )
+
+        if self.max_parallel > 1:
+            # Runs finish out of order; list them in the summary as planned
+            self.aggregator.clear()
+            self.aggregator.add_results(results)
+
+        return results
+
+    async def _run_in_container(
+        self,
+        manager: DockerContainerManager,
+        env_vars: Dict[str, str],
+        count: int,
+        make_config: Callable[[int], TestConfig],
+        sample_loader: SampleLoader,
+        wait_seconds: int,
+    ) -> TestResult:
+        """
+        Start a container, run a load test against it, then remove it.
+
+        Docker calls run in a worker thread, so containers starting or stopping
+        don't stall tests running against other containers.
+        """
+        try:
+            await asyncio.to_thread(manager.start, env_vars, wait_seconds)
+            self.logger.info("")
+            self.logger.info("=" * 50)
+            self.logger.info(f" Testing with DXR_ODC_DATASOURCE_COUNT={count}")
+            self.logger.info("=" * 50)
+
+            config = make_config(count)
+            config.server_url = f"http://localhost:{manager.port}"
+            tester = LoadTester(config, sample_loader=sample_loader)
+            result = await tester.run()
+            self.aggregator.add_result(result)
+            self.aggregator.print_single_result(result)
+
+            self.logger.info(f"Completed run with count={count}")
+        finally:
+            await asyncio.to_thread(manager.stop)
+
+        return result
+
     def get_aggregator(self) -> ResultAggregator:
         """Get the result aggregator for additional processing."""
         return self.aggregator